@@ -0,0 +1,94 @@
+"""
+Tests for file handling in tools/release_automation.py.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.release_automation import ReleaseAutomation
+
+
+class ReleaseTestCase(unittest.TestCase):
+    """Release automation rooted at a scratch checkout."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        (self.root / "setup.py").write_text('setup(name="plhub", version="0.5.1")\n')
+        self.release = ReleaseAutomation(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+class TestAtomicWrite(ReleaseTestCase):
+    """Version files are rewritten in place only when their content changes."""
+
+    @unittest.skipIf(os.name == "nt", "POSIX permission bits")
+    def test_preserves_file_mode(self):
+        script = self.root / "plhub.py"
+        script.write_text("# PL-Hub v0.5.1\n")
+        script.chmod(0o755)
+
+        self.assertTrue(self.release._atomic_write(script, "# PL-Hub v0.5.2\n"))
+        self.assertEqual(script.read_text(), "# PL-Hub v0.5.2\n")
+        self.assertEqual(stat.S_IMODE(script.stat().st_mode), 0o755)
+        self.assertFalse(script.with_suffix(".py.tmp").exists())
+
+    def test_unchanged_content_is_not_rewritten(self):
+        setup_py = self.root / "setup.py"
+        before = setup_py.stat().st_mtime_ns
+
+        self.assertFalse(self.release._atomic_write(setup_py, setup_py.read_text()))
+        self.assertEqual(setup_py.stat().st_mtime_ns, before)
+
+    def test_messages_follow_write_result(self):
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.release.update_version_strings("0.5.2")
+        self.assertIn("✅ Updated setup.py", out.getvalue())
+
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.release.update_version_strings("0.5.2")
+        self.assertIn("setup.py already up to date", out.getvalue())
+        self.assertNotIn("Updated setup.py", out.getvalue())
+
+
+class TestCleanIfStale(ReleaseTestCase):
+    """Build output is kept only when every artifact is for this exact version."""
+
+    def _dist(self, *names):
+        dist = self.root / "dist"
+        dist.mkdir()
+        for name in names:
+            (dist / name).write_text("artifact")
+        return dist
+
+    def test_keeps_current_artifacts(self):
+        dist = self._dist("plhub-0.5.2.tar.gz", "plhub-0.5.2-py3-none-any.whl")
+        self.release._clean_if_stale(dist, "0.5.2")
+        self.assertTrue(dist.exists())
+
+    def test_removes_other_versions_containing_version(self):
+        for names in (["plhub-0.5.20.tar.gz"], ["plhub-10.5.2.tar.gz"], ["plhub-0.5.2rc1.tar.gz"]):
+            with self.subTest(names=names):
+                dist = self._dist(*names)
+                self.release._clean_if_stale(dist, "0.5.2")
+                self.assertFalse(dist.exists())
+
+    def test_removes_mixed_versions(self):
+        dist = self._dist("plhub-0.5.2.tar.gz", "plhub-0.5.1-py3-none-any.whl")
+        self.release._clean_if_stale(dist, "0.5.2")
+        self.assertFalse(dist.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
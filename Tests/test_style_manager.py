@@ -0,0 +1,116 @@
+"""
+Tests for theme discovery and slugs in tools/style_manager.py.
+"""
+
+import itertools
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools import style_manager
+from tools.style_manager import StyleManager
+
+
+def _reference_slugify(value):
+    """Character loop StyleManager.slugify used before the translate rewrite."""
+    cleaned = []
+    for ch in value.strip().lower():
+        if ch.isalnum():
+            cleaned.append(ch)
+        elif ch in {" ", "-", "_", "."}:
+            cleaned.append("_")
+    slug = "".join(cleaned)
+    while "__" in slug:
+        slug = slug.replace("__", "_")
+    slug = slug.strip("_")
+    return slug or "style"
+
+
+SLUG_SAMPLES = [
+    "", "   ", "___", "Ocean Breeze", "  Dark-Mode.v2  ", "neon__glow", "a - b . c",
+    "Crème Brûlée", "Straße", "İstanbul", "東京 Night", "x²", "١٢٣ theme",
+    "tab\there", "new\nline", "emoji 🌊 wave", "ÀÉÎ-õü", "semi;colon:and/slash",
+]
+
+
+class TestSlugify(unittest.TestCase):
+    """slugify must keep producing the keys the character loop produced."""
+
+    def test_samples_match_reference(self):
+        for value in SLUG_SAMPLES:
+            with self.subTest(value=value):
+                self.assertEqual(style_manager._slugify(value), _reference_slugify(value))
+
+    def test_short_combinations_match_reference(self):
+        alphabet = "aZ9 -_.!é\t"
+        for length in range(1, 4):
+            for chars in itertools.product(alphabet, repeat=length):
+                value = "".join(chars)
+                self.assertEqual(style_manager._slugify(value), _reference_slugify(value), repr(value))
+
+    def test_single_code_points_match_reference(self):
+        for code in range(0x3000):
+            value = "a" + chr(code) + "b"
+            self.assertEqual(style_manager._slugify(value), _reference_slugify(value), hex(code))
+
+
+class TestThemeMetadata(unittest.TestCase):
+    """Name/description read while loading themes."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.styles_dir = self.root / StyleManager.BUILTIN_DIR_NAME
+        self.styles_dir.mkdir()
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _write_theme(self, file_name, theme):
+        path = self.styles_dir / file_name
+        path.write_text(json.dumps(theme, indent=2), encoding="utf-8")
+        return path
+
+    @staticmethod
+    def _palette():
+        return {f"color_{i}": f"#{i:06x}" for i in range(400)}
+
+    def test_description_after_large_body(self):
+        """A description placed after a large body is still picked up."""
+        path = self._write_theme("big_theme.json", {
+            "name": "Big Theme",
+            "palette": self._palette(),
+            "description": "Listed after the palette",
+        })
+        self.assertGreater(path.stat().st_size, 4096)
+
+        record = StyleManager(self.root).resolve("big_theme")
+        self.assertEqual(record.name, "Big Theme")
+        self.assertEqual(record.description, "Listed after the palette")
+
+    def test_large_theme_with_broken_tail_is_skipped(self):
+        """Valid metadata up front does not make a corrupt file loadable."""
+        self._write_theme("good_theme.json", {"name": "Good Theme"})
+        path = self._write_theme("broken_theme.json", {
+            "name": "Broken Theme",
+            "description": "Up front",
+            "palette": self._palette(),
+        })
+        path.write_bytes(path.read_bytes()[:-20])
+        self.assertGreater(path.stat().st_size, 4096)
+
+        manager = StyleManager(self.root)
+        self.assertEqual([r.key for r in manager.builtin_styles()], ["good_theme"])
+        with self.assertRaises(KeyError):
+            manager.resolve("broken_theme")
+
+        # Still skipped when the metadata cache is read back
+        self.assertEqual([r.key for r in StyleManager(self.root).builtin_styles()], ["good_theme"])
+
+if __name__ == "__main__":
+    unittest.main()
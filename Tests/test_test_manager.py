@@ -0,0 +1,181 @@
+"""
+Tests for the platform test runners in tools/test_manager.py.
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools import test_manager
+from tools.test_manager import (
+    AndroidTestRunner,
+    IOSTestRunner,
+    MacOSTestRunner,
+    PohTestManager,
+    PohTestSuite,
+    PohTestType,
+    WebTestRunner,
+    WindowsTestRunner,
+)
+
+
+def _parse(runner_class, lines):
+    """Feed output lines to a runner's parser and return its results."""
+    runner = runner_class(Path(tempfile.gettempdir()), "test")
+    results = []
+    for line in lines:
+        runner._parse_line(line, results)
+    return runner, results
+
+
+def _summary(results):
+    return [(r.test_name, r.status, r.duration) for r in results]
+
+
+class TestAndroidParser(unittest.TestCase):
+    """Gradle --console=plain result lines."""
+
+    def test_statuses(self):
+        _, results = _parse(AndroidTestRunner, [
+            "com.example.CalculatorTest > addition PASSED",
+            "  com.example.CalculatorTest > division FAILED",
+            "com.example.NetworkTest > fetch SKIPPED",
+            "> Task :app:testDebugUnitTest",
+            "BUILD SUCCESSFUL in 4s",
+        ])
+        self.assertEqual(_summary(results), [
+            ("com.example.CalculatorTest", "passed", 0.0),
+            ("com.example.CalculatorTest", "failed", 0.0),
+            ("com.example.NetworkTest", "skipped", 0.0),
+        ])
+
+    def test_passed_wins_over_other_statuses(self):
+        _, results = _parse(AndroidTestRunner, [
+            "RetryTest > flaky FAILED then PASSED",
+            "SkipTest > guarded SKIPPED, see PASSED run",
+        ])
+        self.assertEqual([r.status for r in results], ["passed", "passed"])
+
+    def test_status_word_without_spacing(self):
+        _, results = _parse(AndroidTestRunner, ["LoginTest:PASSED"])
+        self.assertEqual(_summary(results), [("LoginTest:PASSED", "passed", 0.0)])
+
+
+class TestXCTestParser(unittest.TestCase):
+    """XCTest lines are parsed the same for iOS and macOS."""
+
+    LINES = [
+        "Test Suite 'All tests' started at 2026-01-02 03:04:05.678",
+        "Test Case '-[AppTests testLaunch]' started.",
+        "Test Case '-[AppTests testLaunch]' passed (0.012 seconds).",
+        "2026-01-02 03:04:05.700 xcodebuild[123:456] Test Case '-[AppTests testLogin]' failed (1.5 seconds).",
+        "Test Case '-[AppTests testClone]' passed on 'Clone 1 of iPhone 15 - App (4242)' (2 seconds)",
+        "Test Case '-[AppTests testNoTiming]' failed",
+        "Executed 4 tests, with 2 failures (0 unexpected) in 3.512 (3.600) seconds",
+    ]
+    EXPECTED = [
+        ("-[AppTests testLaunch]", "passed", 0.012),
+        ("-[AppTests testLogin]", "failed", 1.5),
+        ("-[AppTests testClone]", "passed", 2.0),
+        ("-[AppTests testNoTiming]", "failed", 0.0),
+    ]
+
+    def test_ios(self):
+        _, results = _parse(IOSTestRunner, self.LINES)
+        self.assertEqual(_summary(results), self.EXPECTED)
+
+    def test_macos(self):
+        _, results = _parse(MacOSTestRunner, self.LINES)
+        self.assertEqual(_summary(results), self.EXPECTED)
+
+
+class TestDotnetParser(unittest.TestCase):
+    """dotnet test only reports per-assembly totals."""
+
+    def test_current_summary_line(self):
+        runner, results = _parse(WindowsTestRunner, [
+            "  Determining projects to restore...",
+            "Failed!  - Failed:     2, Passed:    10, Skipped:     1, Total:    13, Duration: 1 s - App.Tests.dll (net8.0)",
+            "Passed!  - Failed:     0, Passed:     4, Skipped:     0, Total:     4, Duration: 320 ms - Core.Tests.dll (net8.0)",
+        ])
+        self.assertEqual(runner._summary_counts, {"failed": 2, "passed": 14, "skipped": 1})
+        self.assertEqual(
+            [(r.status, r.error_message) for r in results],
+            [("failed", "2 tests failed"), ("passed", "10 tests passed"),
+             ("skipped", "1 tests skipped"), ("passed", "4 tests passed")],
+        )
+
+    def test_bare_count(self):
+        runner, results = _parse(WindowsTestRunner, ["Passed! 7 tests", "Failed! 0 tests"])
+        self.assertEqual(runner._summary_counts, {"passed": 7})
+        self.assertEqual(_summary(results), [("dotnet-summary", "passed", 0.0)])
+
+
+class TestWebParser(unittest.TestCase):
+    """Jest/Vitest lines keep the whole line as the test name."""
+
+    def test_statuses(self):
+        runner = WebTestRunner(Path(tempfile.gettempdir()), "web")
+        runner._test_type = PohTestType.E2E
+        results = []
+        for line in [
+            " PASS  src/math.test.js",
+            "   ✓ adds numbers (3 ms)",
+            "   ✗ divides by zero",
+            " FAIL  src/api.test.js",
+            "Tests:       1 failed, 1 passed, 2 total",
+            "   ✓ " + "x" * 150,
+        ]:
+            runner._parse_line(line, results)
+
+        self.assertEqual([(r.test_name, r.status) for r in results[:4]], [
+            ("PASS  src/math.test.js", "passed"),
+            ("✓ adds numbers (3 ms)", "passed"),
+            ("✗ divides by zero", "failed"),
+            ("FAIL  src/api.test.js", "failed"),
+        ])
+        self.assertEqual(len(results), 5)
+        self.assertEqual(len(results[4].test_name), 100)
+        self.assertTrue(all(r.test_type is PohTestType.E2E for r in results))
+
+
+class TestOutputTail(unittest.TestCase):
+    """Output of a failed command is kept for the report."""
+
+    def setUp(self):
+        self.runner = WebTestRunner(Path(tempfile.gettempdir()), "web")
+
+    def _run(self, code):
+        return self.runner._run_command([sys.executable, "-c", code])
+
+    def test_failed_command_keeps_last_lines(self):
+        lines = "".join(f"print('line {i}'); " for i in range(test_manager._TAIL_LINES + 5))
+        returncode, _ = self._run(lines + "raise SystemExit(3)")
+
+        self.assertEqual(returncode, 3)
+        tail = self.runner.output_tail.splitlines()
+        self.assertEqual(len(tail), test_manager._TAIL_LINES)
+        self.assertEqual(tail[-1], f"line {test_manager._TAIL_LINES + 4}")
+
+    def test_successful_command_keeps_nothing(self):
+        returncode, _ = self._run("print('PASS all')")
+
+        self.assertEqual(returncode, 0)
+        self.assertEqual(self.runner.output_tail, "")
+
+    def test_display_shows_tail_of_failed_run(self):
+        suite = PohTestSuite("web", 1, 1, 0, 0, 0.1, [], output_tail="npm ERR! missing script\n")
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            PohTestManager().display_results(suite)
+
+        self.assertIn("Command failed, last output:\n  npm ERR! missing script\n", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,257 @@
+"""
+Tests for the PohLang test runner in tools/test_runner.py.
+
+A small Python script stands in for the pohlang binary so process handling
+can be exercised without the real runtime.
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest import mock
+from xml.etree import ElementTree
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.test_runner import PohTestResult, PohTestRunner, PohTestSuite
+
+
+# Logs every invocation. `--run` interprets just enough PohLang for the tests:
+# Write "..." prints, Import "..." runs another file, and a line reading
+# "fail" exits with an error. `--driver` either answers the driver protocol
+# or rejects the flag.
+FAKE_POHLANG = textwrap.dedent('''\
+    import json, os, sys
+    with open(os.environ["FAKE_POHLANG_LOG"], "a") as log:
+        log.write(" ".join([sys.argv[1]] + [os.path.basename(a) for a in sys.argv[2:]]) + "\\n")
+
+    def run(path):
+        for line in open(path).read().splitlines():
+            if line.startswith('Write "'):
+                print(line[7:-1])
+            elif line.startswith('Import "'):
+                run(line[8:-1])
+            elif line == "fail":
+                sys.exit(1)
+
+    if sys.argv[1] == "--run":
+        run(sys.argv[2])
+        sys.exit(0)
+    if sys.argv[1] == "--driver" and os.environ.get("FAKE_POHLANG_DRIVER"):
+        print(json.dumps({"ready": True}), flush=True)
+        for line in sys.stdin:
+            path = line.strip()
+            ok = "fail" not in open(path).read().splitlines()
+            reply = {"ok": ok, "out": "driver " + os.path.basename(path), "err": "failed"}
+            print(json.dumps(reply), flush=True)
+        sys.exit(0)
+    sys.stderr.write("unknown option " + sys.argv[1] + "\\n")
+    sys.exit(2)
+''')
+
+
+@unittest.skipIf(os.name == 'nt', "fake runtime is a POSIX script")
+class FakeRuntimeTestCase(unittest.TestCase):
+    """Project with two tests and a fake pohlang binary."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.tests_dir = self.root / 'tests'
+        self.tests_dir.mkdir()
+        self.write_test('a_test.poh', 'Write "a"\n')
+        self.write_test('b_test.poh', 'Write "b"\nfail\n')
+
+        bin_dir = self.root / 'hub' / 'bin'
+        bin_dir.mkdir(parents=True)
+        script = bin_dir / 'pohlang'
+        script.write_text(f"#!{sys.executable}\n" + FAKE_POHLANG)
+        script.chmod(0o755)
+
+        self.log_file = self.root / 'calls.log'
+        self._saved_env = {k: os.environ.get(k) for k in ('FAKE_POHLANG_LOG', 'FAKE_POHLANG_DRIVER')}
+        os.environ['FAKE_POHLANG_LOG'] = str(self.log_file)
+        os.environ.pop('FAKE_POHLANG_DRIVER', None)
+
+    def tearDown(self):
+        for key, value in self._saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def write_test(self, name, source):
+        (self.tests_dir / name).write_text(source)
+
+    def make_runner(self, **kwargs) -> PohTestRunner:
+        runner = PohTestRunner(self.root, sequential=True, **kwargs)
+        runner.plhub_root = self.root / 'hub'
+        return runner
+
+    def run_suite(self, runner, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return runner.run_all_tests(**kwargs)
+
+    def calls(self):
+        return self.log_file.read_text().splitlines()
+
+
+class TestDriverMode(FakeRuntimeTestCase):
+    """Persistent `pohlang --driver` processes are strictly opt-in."""
+
+    def test_driver_not_used_by_default(self):
+        os.environ['FAKE_POHLANG_DRIVER'] = '1'
+        suite = self.run_suite(self.make_runner())
+
+        self.assertEqual(self.calls(), ['--run a_test.poh', '--run b_test.poh'])
+        self.assertEqual([r.output for r in suite.results], ['a\n', 'b\n'])
+
+    def test_driver_path(self):
+        os.environ['FAKE_POHLANG_DRIVER'] = '1'
+        suite = self.run_suite(self.make_runner(driver=True))
+
+        # One driver serves both tests
+        self.assertEqual(self.calls(), ['--driver'])
+        self.assertEqual([r.output for r in suite.results], ['driver a_test.poh', 'driver b_test.poh'])
+        self.assertEqual([r.passed for r in suite.results], [True, False])
+        self.assertEqual(suite.results[1].error, 'failed')
+
+    def test_fallback_when_runtime_lacks_driver(self):
+        runner = self.make_runner(driver=True)
+        suite = self.run_suite(runner)
+
+        # Rejected once, then every test gets its own process
+        self.assertEqual(self.calls(), ['--driver', '--run a_test.poh', '--run b_test.poh'])
+        self.assertFalse(runner._driver_supported)
+        self.assertEqual([r.output for r in suite.results], ['a\n', 'b\n'])
+        self.assertEqual([r.passed for r in suite.results], [True, False])
+
+
+class TestBatchMode(FakeRuntimeTestCase):
+    """Several test files sharing one interpreter through an Import script."""
+
+    def test_markers_split_output_per_file(self):
+        self.write_test('b_test.poh', 'Write "b1"\nWrite "b2"\n')
+        self.write_test('c_test.poh', 'Write "c"\n')
+        suite = self.run_suite(self.make_runner(), batch_size=3)
+
+        self.assertEqual(self.calls(), ['--run _batch.poh'])
+        self.assertEqual(
+            {r.name: r.output for r in suite.results},
+            {'a_test': 'a\n', 'b_test': 'b1\nb2\n', 'c_test': 'c\n'},
+        )
+        self.assertTrue(all(r.passed for r in suite.results))
+
+    def test_failure_and_unreached_files_rerun_alone(self):
+        self.write_test('c_test.poh', 'Write "c"\n')
+        suite = self.run_suite(self.make_runner(), batch_size=3)
+
+        self.assertEqual(self.calls(), ['--run _batch.poh', '--run b_test.poh', '--run c_test.poh'])
+        self.assertEqual([r.output for r in suite.results], ['a\n', 'b\n', 'c\n'])
+        self.assertEqual([r.passed for r in suite.results], [True, False, True])
+
+    def test_unquotable_paths_run_on_their_own(self):
+        self.write_test('b_test.poh', 'Write "b"\n')
+        self.write_test('q"uote_test.poh', 'Write "q"\n')
+        self.write_test('back\\slash_test.poh', 'Write "s"\n')
+        suite = self.run_suite(self.make_runner(), batch_size=4)
+
+        calls = self.calls()
+        self.assertEqual(len(calls), 3)
+        self.assertIn('--run _batch.poh', calls)
+        self.assertIn('--run q"uote_test.poh', calls)
+        self.assertIn('--run back\\slash_test.poh', calls)
+        self.assertEqual(
+            {r.name: r.output for r in suite.results},
+            {'a_test': 'a\n', 'b_test': 'b\n', 'q"uote_test': 'q\n', 'back\\slash_test': 's\n'},
+        )
+
+
+def _make_suite(timestamp='2026-01-02T03:04:05'):
+    results = [
+        PohTestResult('a_test', 'tests/a_test.poh', True, 0.5, 'ok\n'),
+        PohTestResult('b_test', 'tests/b_test.poh', False, 0.25, '', 'boom'),
+    ]
+    return PohTestSuite(2, 1, 1, 0, 0.75, results, timestamp)
+
+
+class TestSaveResults(unittest.TestCase):
+    """latest.json is a hardlink, else a symlink, else a copy of the run file."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.runner = PohTestRunner(self.root)
+        self.results_dir = self.runner.results_dir
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _save(self, suite):
+        self.runner.save_results(suite)
+        run_file = self.results_dir / f"test-{suite.timestamp.replace(':', '-')}.json"
+        latest = self.results_dir / 'latest.json'
+        self.assertEqual(latest.read_bytes(), run_file.read_bytes())
+        self.assertFalse((self.results_dir / 'latest.json.tmp').exists())
+        return run_file, latest
+
+    def test_hardlink(self):
+        run_file, latest = self._save(_make_suite())
+
+        self.assertTrue(os.path.samefile(run_file, latest))
+        data = json.loads(latest.read_text())
+        self.assertEqual(data['suite']['total'], 2)
+        self.assertEqual([r['name'] for r in data['results']], ['a_test', 'b_test'])
+
+    def test_symlink_when_hardlinks_fail(self):
+        with mock.patch('tools.test_runner.os.link', side_effect=OSError):
+            run_file, latest = self._save(_make_suite())
+
+        self.assertTrue(latest.is_symlink())
+        self.assertEqual(os.readlink(latest), run_file.name)
+
+    def test_copy_when_links_fail(self):
+        with mock.patch('tools.test_runner.os.link', side_effect=OSError), \
+                mock.patch.object(Path, 'symlink_to', side_effect=OSError):
+            run_file, latest = self._save(_make_suite())
+
+        self.assertFalse(latest.is_symlink())
+        self.assertFalse(os.path.samefile(run_file, latest))
+
+    def test_later_run_replaces_latest(self):
+        self._save(_make_suite('2026-01-02T03:04:05'))
+        run_file, latest = self._save(_make_suite('2026-01-02T03:04:06'))
+
+        self.assertTrue(os.path.samefile(run_file, latest))
+
+
+class TestJUnitReport(unittest.TestCase):
+    """generate_ci_report('junit') must stay well-formed XML."""
+
+    def test_names_and_errors_are_escaped(self):
+        suite = _make_suite()
+        suite.results[1] = PohTestResult(
+            'b<&>"test\'', 'tests/b "quoted" & <odd>.poh', False, 0.25, '',
+            'expected <1> & got "2"',
+        )
+        report = PohTestRunner(Path(tempfile.gettempdir())).generate_ci_report(suite, format='junit')
+
+        root = ElementTree.fromstring(report.encode('utf-8'))
+        cases = root.findall('testcase')
+        self.assertEqual([c.get('name') for c in cases], ['a_test', 'b<&>"test\''])
+        self.assertEqual(cases[1].get('classname'), 'tests/b "quoted" & <odd>.poh')
+        failure = cases[1].find('failure')
+        self.assertEqual(failure.get('message'), 'expected <1> & got "2"')
+        self.assertEqual(failure.text.strip(), 'expected <1> & got "2"')
+        self.assertIsNone(cases[0].find('failure'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Tests for the command-line UI helpers in tools/ui_helpers.py.
+"""
+
+import contextlib
+import difflib
+import io
+import itertools
+import os
+import signal
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools import ui_helpers
+
+
+def _reference_fuzzy_match(needle, haystack, threshold=0.6):
+    """Scan-and-sort fuzzy_match from before the rewrite."""
+    matches = []
+    for item in haystack:
+        ratio = difflib.SequenceMatcher(None, needle.lower(), item.lower()).ratio()
+        if ratio >= threshold:
+            matches.append((ratio, item))
+    matches.sort(reverse=True, key=lambda x: x[0])
+    return [item for _, item in matches]
+
+
+COMMANDS = [
+    "run", "build", "test", "create", "watch", "dev", "style", "widget", "update-sdk",
+    "release", "clean", "install", "Build", "list", "publish", "Run", "guild", "built",
+]
+
+
+class TestFuzzyMatch(unittest.TestCase):
+    """Suggestions are ordered by score, ties in haystack order."""
+
+    def test_ties_keep_haystack_order(self):
+        self.assertEqual(ui_helpers.fuzzy_match("ab", ["ad", "ac", "ae"], threshold=0.5), ["ad", "ac", "ae"])
+        self.assertEqual(ui_helpers.fuzzy_match("ab", ["ae", "ac", "ad"], threshold=0.5), ["ae", "ac", "ad"])
+
+    def test_case_variants_keep_haystack_order(self):
+        self.assertEqual(
+            ui_helpers.fuzzy_match("bild", ["Build", "guild", "build"], threshold=0.5),
+            _reference_fuzzy_match("bild", ["Build", "guild", "build"], threshold=0.5),
+        )
+
+    def test_matches_reference(self):
+        needles = ["", "b", "bulid", "RUN", "tset", "updat", "widgte", "xyz", "stlye", "instal"]
+        for needle, threshold in itertools.product(needles, (0.0, 0.4, 0.5, 0.6, 0.8, 1.0)):
+            with self.subTest(needle=needle, threshold=threshold):
+                self.assertEqual(
+                    ui_helpers.fuzzy_match(needle, COMMANDS, threshold),
+                    _reference_fuzzy_match(needle, COMMANDS, threshold),
+                )
+
+    def test_scores_keep_needle_first(self):
+        # ratio() is not symmetric: "--ab-aa" scores 0.44 against "ba" but 0.22 the other way round
+        haystack = ["ca--", "--ab-aa", "-b", "bba", "cca-cb-", "cbcbb"]
+        self.assertEqual(ui_helpers.fuzzy_match("ba", haystack, 0.3), _reference_fuzzy_match("ba", haystack, 0.3))
+        self.assertIn("--ab-aa", ui_helpers.fuzzy_match("ba", haystack, 0.4))
+
+    def test_empty_haystack(self):
+        self.assertEqual(ui_helpers.fuzzy_match("run", []), [])
+
+
+class TestTermWidth(unittest.TestCase):
+    """Terminal width is cached briefly, without signal handlers."""
+
+    def setUp(self):
+        ui_helpers._TERM_W[:] = [0, float('-inf')]
+
+    def tearDown(self):
+        ui_helpers._TERM_W[:] = [0, float('-inf')]
+
+    @unittest.skipUnless(hasattr(signal, 'SIGWINCH'), "no SIGWINCH on this platform")
+    def test_import_leaves_sigwinch_alone(self):
+        code = (
+            "import signal, sys; sys.path.insert(0, sys.argv[1]); "
+            "import tools.ui_helpers; "
+            "print(signal.getsignal(signal.SIGWINCH) == signal.SIG_DFL)"
+        )
+        root = str(Path(__file__).parent.parent)
+        out = subprocess.run([sys.executable, "-c", code, root], capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "True")
+
+    def test_requeried_after_ttl(self):
+        sizes = iter([os.terminal_size((100, 20)), os.terminal_size((60, 20))])
+        clock = [1000.0]
+        with mock.patch.object(ui_helpers.shutil, 'get_terminal_size', side_effect=lambda *_: next(sizes)), \
+                mock.patch.object(ui_helpers.time, 'monotonic', side_effect=lambda: clock[0]):
+            self.assertEqual(ui_helpers._term_width(), 100)
+            clock[0] += ui_helpers._TERM_WIDTH_TTL / 2
+            self.assertEqual(ui_helpers._term_width(), 100)
+            clock[0] += ui_helpers._TERM_WIDTH_TTL
+            self.assertEqual(ui_helpers._term_width(), 60)
+
+
+class TestLazyColors(unittest.TestCase):
+    """Colour support is resolved before the first coloured output."""
+
+    def setUp(self):
+        Color = ui_helpers.Color
+        self._codes = {k: v for k, v in vars(Color).items() if k.isupper()}
+        self._methods = {k: v for k, v in vars(ui_helpers.UI).items() if isinstance(v, staticmethod)}
+        self._prefixes = dict(ui_helpers._PFX)
+        self._resolved = ui_helpers._colors_resolved
+        ui_helpers._colors_resolved = False
+
+    def tearDown(self):
+        for attr, code in self._codes.items():
+            setattr(ui_helpers.Color, attr, code)
+        for name, method in self._methods.items():
+            setattr(ui_helpers.UI, name, method)
+        ui_helpers._PFX.clear()
+        ui_helpers._PFX.update(self._prefixes)
+        ui_helpers._colors_resolved = self._resolved
+
+    def _windows_without_ansi(self):
+        # Color.enabled() takes its win32 branch, where ctypes.windll is missing
+        # here; colorama is made unimportable so colours get disabled
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(ui_helpers.sys, 'platform', 'win32'))
+        stack.enter_context(mock.patch.dict(sys.modules, {'colorama': None}))
+        stack.enter_context(mock.patch.dict(os.environ, {'PLHUB_NO_COLOR': ''}))
+        return stack
+
+    def test_first_ui_call_resolves_colors(self):
+        out = io.StringIO()
+        with self._windows_without_ansi(), contextlib.redirect_stdout(out):
+            ui_helpers.UI.success("done")
+            ui_helpers.UI.header("Title")
+
+        self.assertTrue(ui_helpers._colors_resolved)
+        self.assertEqual(out.getvalue(), f"{ui_helpers.Icon.SUCCESS} done\n\nTitle\n=====\n")
+        self.assertEqual(ui_helpers.Color.GREEN, '')
+
+    def test_explicit_resolve_before_direct_reads(self):
+        with self._windows_without_ansi():
+            ui_helpers._ensure_colors()
+            self.assertEqual(f"{ui_helpers.Color.GREEN}new{ui_helpers.Color.RESET}", "new")
+
+    def test_supported_terminal_keeps_codes(self):
+        with mock.patch.object(ui_helpers.Color, 'enabled', return_value=True):
+            ui_helpers._ensure_colors()
+        self.assertEqual(ui_helpers.Color.GREEN, '\033[32m')
+        self.assertEqual(ui_helpers._PFX['success'], f"\033[32m{ui_helpers.Icon.SUCCESS} ")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""
+Tests for the SDK sync helpers in tools/update_sdk.py.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools import update_sdk
+
+
+# Two mtimes inside the same whole second, as a fresh checkout produces
+SECOND_NS = 1_700_000_000 * 1_000_000_000
+EARLY_NS = SECOND_NS + 100_000_000
+LATE_NS = SECOND_NS + 900_000_000
+
+
+class TestQuickCompare(unittest.TestCase):
+    """Size+mtime shortcut used before falling back to hashing."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.main = self.root / "setup.py"
+        self.sdk_dir = self.root / "plhub-sdk"
+        self.sdk_dir.mkdir()
+        self.sdk = self.sdk_dir / "setup.py"
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_same_size_same_second_edit_is_detected(self):
+        """A length-preserving edit within the same second must not look in sync."""
+        self.sdk.write_text('version="0.5.1"\n')
+        self.main.write_text('version="0.5.2"\n')
+        os.utime(self.sdk, ns=(EARLY_NS, EARLY_NS))
+        os.utime(self.main, ns=(LATE_NS, LATE_NS))
+
+        self.assertIsNone(update_sdk._quick_equal(self.main, self.sdk))
+        self.assertFalse(update_sdk._files_match((self.main, self.sdk)))
+
+        updater = update_sdk.SDKUpdater(self.root)
+        with contextlib.redirect_stdout(io.StringIO()):
+            updater.sync_file("setup.py")
+        self.assertEqual(self.sdk.read_text(), 'version="0.5.2"\n')
+
+    def test_copy2_copy_is_trusted_without_hashing(self):
+        """Exactly equal mtimes (what copy2 leaves behind) short-circuit to in sync."""
+        self.main.write_text("content\n")
+        shutil.copy2(self.main, self.sdk)
+
+        self.assertTrue(update_sdk._quick_equal(self.main, self.sdk))
+        self.assertTrue(update_sdk._files_match((self.main, self.sdk)))
+
+    def test_size_difference_is_out_of_sync(self):
+        """Different sizes are out of sync whatever the mtimes say."""
+        self.main.write_text("longer content\n")
+        self.sdk.write_text("short\n")
+        os.utime(self.sdk, ns=(EARLY_NS, EARLY_NS))
+        os.utime(self.main, ns=(EARLY_NS, EARLY_NS))
+
+        self.assertFalse(update_sdk._quick_equal(self.main, self.sdk))
+
+
+class TestDiffTrees(unittest.TestCase):
+    """Incremental --force sync of an existing SDK directory."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.main = self.root / "docs"
+        self.sdk = self.root / "plhub-sdk" / "docs"
+        self._write(self.main, {
+            "same.md": "unchanged\n",
+            "edited.md": "version 2\n",
+            "guides/new.md": "added\n",
+            "guides/deeper/fresh.md": "added too\n",
+        })
+        self._write(self.sdk, {
+            "same.md": "unchanged\n",
+            "edited.md": "version 1\n",
+            "stale.md": "removed upstream\n",
+            "old/nested/gone.md": "removed with its directories\n",
+        })
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    @staticmethod
+    def _write(base, files):
+        for rel, content in files.items():
+            path = base / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+
+    @staticmethod
+    def _snapshot(base):
+        return {
+            path.relative_to(base).as_posix(): path.read_text()
+            for path in base.rglob("*") if path.is_file()
+        }
+
+    def test_copies_new_and_changed_deletes_removed(self):
+        to_copy, to_delete, to_clear = update_sdk._diff_trees(self.main, self.sdk, deep=True)
+
+        sep = os.sep
+        self.assertEqual(to_copy, [f"guides{sep}deeper{sep}fresh.md", f"guides{sep}new.md", "edited.md"])
+        # Files first, then directories deepest first so each is empty when removed
+        self.assertEqual(to_delete, [f"old{sep}nested{sep}gone.md", "stale.md", f"old{sep}nested", "old"])
+        self.assertEqual(to_clear, [])
+
+    def test_force_sync_mirrors_main(self):
+        updater = update_sdk.SDKUpdater(self.root)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertTrue(updater.sync_directory("docs", force=True))
+
+        self.assertEqual(self._snapshot(self.sdk), self._snapshot(self.main))
+        self.assertFalse((self.sdk / "old").exists())
+        self.assertIn("3 updated, 4 removed", out.getvalue())
+
+    def test_in_sync_tree_is_left_alone(self):
+        shutil.rmtree(self.sdk)
+        shutil.copytree(self.main, self.sdk)
+
+        self.assertEqual(update_sdk._diff_trees(self.main, self.sdk, deep=True), ([], [], []))
+
+    def _force_sync(self):
+        updater = update_sdk.SDKUpdater(self.root)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertTrue(updater.sync_directory("docs", force=True))
+        self.assertEqual(self._snapshot(self.sdk), self._snapshot(self.main))
+        return out.getvalue()
+
+    def test_file_replacing_directory(self):
+        self._write(self.main, {"api": "now a single page\n"})
+        self._write(self.sdk, {"api/index.md": "old index\n", "api/deep/ref.md": "old ref\n"})
+
+        _, to_delete, to_clear = update_sdk._diff_trees(self.main, self.sdk, deep=True)
+        self.assertEqual(to_clear, ["api"])
+        self.assertFalse(any(rel.startswith("api") for rel in to_delete))
+
+        self._force_sync()
+        self.assertTrue((self.sdk / "api").is_file())
+
+    def test_directory_replacing_file(self):
+        self._write(self.main, {"api/index.md": "split into pages\n", "api/deep/ref.md": "ref\n"})
+        self._write(self.sdk, {"api": "old single page\n"})
+
+        self.assertEqual(update_sdk._diff_trees(self.main, self.sdk, deep=True)[2], ["api"])
+
+        self._force_sync()
+        self.assertTrue((self.sdk / "api").is_dir())
+
+
+if __name__ == "__main__":
+    unittest.main()
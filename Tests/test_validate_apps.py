@@ -0,0 +1,97 @@
+"""
+Tests for the complete-application validator in tools/validate_apps.py.
+"""
+
+import contextlib
+import io
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.validate_apps import AppValidator
+
+
+class TestValidateAll(unittest.TestCase):
+    """Apps are checked concurrently but reported in name order."""
+
+    def setUp(self):
+        self.apps_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.apps_dir, ignore_errors=True)
+
+    def _make_app(self, name, valid=True):
+        app = self.apps_dir / name
+        (app / "src").mkdir(parents=True)
+        (app / "tests").mkdir()
+        (app / "src" / "main.poh").write_text('Write "hi"\n')
+        (app / "tests" / "main_test.poh").write_text('Write "ok"\n')
+        (app / "README.md").write_text("# App\n" + "Documentation line.\n" * 10)
+        config = {"name": name, "version": "1.0.0", "main": "src/main.poh"}
+        if not valid:
+            del config["main"]
+        (app / "plhub.json").write_text(json.dumps(config))
+
+    def _validate(self):
+        validator = AppValidator(self.apps_dir)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            success = validator.validate_all()
+        return success, out.getvalue(), validator
+
+    def test_reports_in_name_order(self):
+        names = ["zeta", "alpha", "mu", "beta", "omega", "delta", "kappa", "gamma"]
+        for index, name in enumerate(names):
+            self._make_app(name, valid=index % 3 != 0)
+        (self.apps_dir / ".hidden").mkdir()
+
+        success, output, validator = self._validate()
+
+        self.assertFalse(success)
+        ordered = sorted(names)
+        self.assertEqual([name for name, _ in validator.results], ordered)
+        headers = [output.index(f"═══ {name.upper()} ═══") for name in ordered]
+        self.assertEqual(headers, sorted(headers))
+        self.assertNotIn("HIDDEN", output)
+        self.assertIn(f"Found {len(names)} applications to validate", output)
+
+        # Each block holds its own app's failure detail
+        blocks = output.split("\n\n")
+        zeta = next(block for block in blocks if block.startswith("═══ ZETA ═══"))
+        self.assertIn("Missing fields: main", zeta)
+        self.assertIn("❌ plhub.json config", zeta)
+
+    def test_summary(self):
+        self._make_app("good")
+        self._make_app("also_good")
+        self._make_app("broken", valid=False)
+
+        success, output, _ = self._validate()
+
+        self.assertFalse(success)
+        summary = output[output.index("VALIDATION SUMMARY"):].splitlines()
+        self.assertEqual(
+            [line.strip() for line in summary if "PASS" in line or "FAIL" in line],
+            ["✅ PASS  also_good", "❌ FAIL  broken", "✅ PASS  good"],
+        )
+        self.assertIn("Total:  3 applications", summary)
+        self.assertIn("Passed: 2 (66%)", summary)
+        self.assertIn("Failed: 1", summary)
+        self.assertEqual(summary[-1], "⚠️  1 application(s) need attention")
+
+    def test_all_valid(self):
+        self._make_app("only")
+
+        success, output, _ = self._validate()
+
+        self.assertTrue(success)
+        self.assertTrue(output.endswith("✨ All applications are valid! 🎉\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Tests for widget template helpers in tools/widget_manager.py.
+"""
+
+import itertools
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.widget_manager import WidgetManager
+
+
+def _reference_slugify(value):
+    """Character loop WidgetManager.slugify used before the regex rewrite."""
+    cleaned = []
+    for ch in value.strip().lower():
+        if ch.isalnum():
+            cleaned.append(ch)
+        elif ch in {" ", "-", "_", "."}:
+            cleaned.append("_")
+    slug = "".join(cleaned)
+    while "__" in slug:
+        slug = slug.replace("__", "_")
+    return slug.strip("_") or "widget"
+
+
+SLUG_SAMPLES = [
+    "", "   ", "___", "Primary Button", "  Nav-Bar.v2  ", "card__header", "a - b . c",
+    "Crème Brûlée", "Straße", "İstanbul", "東京 Widget", "x²", "١٢٣ list",
+    "tab\there", "new\nline", "emoji 🔘 toggle", "ÀÉÎ-õü", "semi;colon:and/slash",
+]
+
+
+class TestSlugify(unittest.TestCase):
+    """slugify must keep producing the keys the character loop produced."""
+
+    def test_samples_match_reference(self):
+        for value in SLUG_SAMPLES:
+            with self.subTest(value=value):
+                self.assertEqual(WidgetManager.slugify(value), _reference_slugify(value))
+
+    def test_short_combinations_match_reference(self):
+        alphabet = "aZ9 -_.!é\t"
+        for length in range(1, 4):
+            for chars in itertools.product(alphabet, repeat=length):
+                value = "".join(chars)
+                self.assertEqual(WidgetManager.slugify(value), _reference_slugify(value), repr(value))
+
+    def test_single_code_points_match_reference(self):
+        for code in range(0x3000):
+            value = "a" + chr(code) + "b"
+            self.assertEqual(WidgetManager.slugify(value), _reference_slugify(value), hex(code))
+
+
+class TestBuiltinTemplates(unittest.TestCase):
+    """Bundled templates are parsed straight from their JSON files."""
+
+    def test_every_bundled_template_loads_without_side_files(self):
+        plhub_root = Path(__file__).parent.parent
+        templates_dir = plhub_root / WidgetManager.BUILTIN_DIR
+        before = sorted(p.name for p in templates_dir.iterdir())
+
+        templates = WidgetManager(plhub_root).builtin_templates()
+
+        json_files = [name for name in before if name.endswith(".json")]
+        self.assertEqual(len(templates), len(json_files))
+        self.assertEqual(sorted(p.name for p in templates_dir.iterdir()), before)
+
+
+class TestGeneratePaths(unittest.TestCase):
+    """Template file paths must stay inside the project."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.templates_dir = self.root / "project" / WidgetManager.PROJECT_TEMPLATES_DIR
+        self.templates_dir.mkdir(parents=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _generate(self, path):
+        template = {"key": "probe", "files": [{"path": path, "content": "x"}]}
+        (self.templates_dir / "probe.json").write_text(json.dumps(template))
+        manager = WidgetManager(self.root / "hub", self.root / "project")
+        return manager.generate("probe", dry_run=True)[1]
+
+    def test_rejects_paths_outside_project(self):
+        for path in [
+            "", "..", "../escape.poh", "ui/../../escape.poh", "ui\\..\\..\\escape.poh",
+            "/etc/passwd", "\\escape.poh", "C:\\Windows\\escape.poh", "C:/escape.poh",
+            "C:escape.poh", "c:ui/escape.poh", "ui/c:escape.poh", "\\\\server\\share\\escape.poh",
+        ]:
+            with self.subTest(path=path), self.assertRaises(ValueError):
+                self._generate(path)
+
+    def test_accepts_project_relative_paths(self):
+        project = self.root / "project"
+        self.assertEqual(self._generate("ui/widgets/probe.poh"), [project / "ui" / "widgets" / "probe.poh"])
+        self.assertEqual(self._generate("ui\\widgets\\probe.poh"), [project / "ui" / "widgets" / "probe.poh"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -34,7 +34,7 @@ from tools.platform_manager import PlatformManager, Platform
 from tools.hotreload_manager import HotReloadManager
 from tools.test_manager import PohTestManager, PohTestType
 from tools.device_manager import UnifiedDeviceManager
-from tools.ui_helpers import UI, Icon, Color, Spinner, ProgressBar, confirm, select, input_text
+from tools.ui_helpers import UI, Icon, Color, Spinner, ProgressBar, confirm, select, input_text, _ensure_colors
 from tools.command_helpers import (
     CommandContext, EnhancedRunner, BuildHelper, InstallHelper,
     PlatformHelper, InteractiveWizard, DebugHelper, ErrorHelper,
@@ -867,6 +867,7 @@ def install_package(args):
         
         # Show dependency summary
         UI.section(f"{Icon.PACKAGE} Dependencies")
+        _ensure_colors()  # Color is read directly below
         for name, ver in config["dependencies"].items():
             marker = "← new" if name == package_name else ""
             UI.bullet(f"{name} {ver} {Color.GREEN}{marker}{Color.RESET}")
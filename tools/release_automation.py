@@ -17,16 +17,44 @@ Usage:
 """
 
 import argparse
+import os
 import subprocess
 import sys
 import re
-import shutil
-import zipfile
 from pathlib import Path
 from datetime import datetime
 from typing import List, Tuple
-import json
-import hashlib
+
+
+# Version patterns per file as (regex, replacement template) pairs. Patterns must
+# not contain capturing groups: each file's patterns are joined into one
+# alternation and the matching group selects the replacement.
+_VERSION_PATTERNS = {
+    "setup.py": [
+        (r'version="[^"]+"', 'version="{version}"'),
+    ],
+    "plhub.py": [
+        (r"PL-Hub v[\d.]+", "PL-Hub v{version}"),
+    ],
+    "plhub-sdk/setup.py": [
+        (r'version="[^"]+"', 'version="{version}"'),
+    ],
+    "plhub-sdk/plhub.py": [
+        (r"PL-Hub v[\d.]+", "PL-Hub v{version}"),
+    ],
+    "plhub-sdk/RELEASE_PACKAGE.md": [
+        (r"Version\*\*: [\d.]+", "Version**: {version}"),
+        (r"PL-Hub v[\d.]+", "PL-Hub v{version}"),
+    ],
+}
+
+_VERSION_SUBSTITUTIONS = {
+    file_path: (
+        re.compile("|".join(f"({pattern})" for pattern, _ in replacements)),
+        tuple(template for _, template in replacements),
+    )
+    for file_path, replacements in _VERSION_PATTERNS.items()
+}
 
 
 class ReleaseAutomation:
@@ -40,6 +68,15 @@ class ReleaseAutomation:
         """Extract current version from setup.py"""
         setup_py = self.root / "setup.py"
         content = setup_py.read_text(encoding="utf-8")
+        
+        # Fast path: plain substring scan for the usual version="x.y.z" layout
+        start = content.find('version="')
+        if start >= 0:
+            start += len('version="')
+            end = content.find('"', start)
+            if end > start:
+                return content[start:end]
+        
         match = re.search(r'version="([^"]+)"', content)
         if match:
             return match.group(1)
@@ -58,41 +95,47 @@ class ReleaseAutomation:
         else:
             raise ValueError(f"Invalid bump type: {bump_type}")
     
+    def _atomic_write(self, path: Path, content: str) -> bool:
+        """Write content via a sibling temp file and rename; skip if unchanged"""
+        import shutil
+        
+        data = content.encode("utf-8")
+        try:
+            existing_size = path.stat().st_size
+        except FileNotFoundError:
+            existing_size = None
+        if existing_size == len(data) and path.read_bytes() == data:
+            return False
+        
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(data)
+        if existing_size is not None:
+            # The rename replaces the inode, so carry over permissions (e.g. +x)
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+        return True
+    
     def update_version_strings(self, new_version: str, feature_name: str = None):
         """Update version in all relevant files"""
         print(f"📝 Updating version from {self.current_version} to {new_version}...")
         
-        files_to_update = {
-            "setup.py": [
-                (r'version="[^"]+"', f'version="{new_version}"'),
-            ],
-            "plhub.py": [
-                (r"PL-Hub v[\d.]+", f"PL-Hub v{new_version}"),
-            ],
-            "plhub-sdk/setup.py": [
-                (r'version="[^"]+"', f'version="{new_version}"'),
-            ],
-            "plhub-sdk/plhub.py": [
-                (r"PL-Hub v[\d.]+", f"PL-Hub v{new_version}"),
-            ],
-            "plhub-sdk/RELEASE_PACKAGE.md": [
-                (r"Version\*\*: [\d.]+", f"Version**: {new_version}"),
-                (r"PL-Hub v[\d.]+", f"PL-Hub v{new_version}"),
-            ],
-        }
-        
-        for file_path, replacements in files_to_update.items():
+        for file_path, (pattern, templates) in _VERSION_SUBSTITUTIONS.items():
             full_path = self.root / file_path
             if not full_path.exists():
                 print(f"  ⚠️  Skipping {file_path} (not found)")
                 continue
                 
             content = full_path.read_text(encoding="utf-8")
-            for pattern, replacement in replacements:
-                content = re.sub(pattern, replacement, content)
+            # One pass per file; the matched group picks the replacement template
+            content = pattern.sub(
+                lambda m: templates[m.lastindex - 1].format(version=new_version),
+                content,
+            )
             
-            full_path.write_text(content, encoding="utf-8")
-            print(f"  ✅ Updated {file_path}")
+            if self._atomic_write(full_path, content):
+                print(f"  ✅ Updated {file_path}")
+            else:
+                print(f"  ⏭️  {file_path} already up to date")
         
         # Update CHANGELOG files
         self._update_changelog(new_version, feature_name)
@@ -132,8 +175,10 @@ class ReleaseAutomation:
             
             # Insert new entry
             lines.insert(insert_idx, new_entry.rstrip())
-            changelog_file.write_text("\n".join(lines), encoding="utf-8")
-            print(f"  ✅ Updated {changelog_file.name}")
+            if self._atomic_write(changelog_file, "\n".join(lines)):
+                print(f"  ✅ Updated {changelog_file.name}")
+            else:
+                print(f"  ⏭️  {changelog_file.name} already up to date")
     
     def _update_release_notes(self, version: str, feature_name: str = None):
         """Create/update RELEASE_NOTES.md"""
@@ -196,11 +241,47 @@ For detailed changes, see [CHANGELOG.md](CHANGELOG.md)
 """
         
         release_notes = self.root / "RELEASE_NOTES.md"
-        release_notes.write_text(content, encoding="utf-8")
-        print(f"  ✅ Created RELEASE_NOTES.md")
+        if self._atomic_write(release_notes, content):
+            print(f"  ✅ Created RELEASE_NOTES.md")
+        else:
+            print(f"  ⏭️  RELEASE_NOTES.md already up to date")
+    
+    def _add_tree_to_zip(self, zipf, root: Path):
+        """Add files under root to zipf, reusing scandir stat results for ZipInfo"""
+        import time
+        import zipfile
+        
+        large_file = 16 * 1024 * 1024
+        pending = [str(root)]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    # Skip pycache and other build artifacts
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != "__pycache__":
+                            pending.append(entry.path)
+                        continue
+                    if not entry.is_file() or entry.name.endswith((".pyc", ".pyo")):
+                        continue
+                    
+                    arcname = os.path.relpath(entry.path, root.parent)
+                    st = entry.stat()
+                    if st.st_size > large_file:
+                        # Stream big files instead of reading them into memory
+                        zipf.write(entry.path, arcname)
+                        continue
+                    
+                    zinfo = zipfile.ZipInfo(arcname, date_time=time.localtime(st.st_mtime)[:6])
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+                    with open(entry.path, "rb", buffering=1 << 20) as f:
+                        zipf.writestr(zinfo, f.read())
     
     def create_sdk_package(self, version: str) -> Path:
         """Create SDK zip package"""
+        import hashlib
+        import zipfile
+        
         print(f"\n📦 Creating SDK package...")
         
         zip_name = f"plhub-sdk-{version}.zip"
@@ -212,14 +293,7 @@ For detailed changes, see [CHANGELOG.md](CHANGELOG.md)
         
         # Create zip
         with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for item in self.sdk_dir.rglob("*"):
-                if item.is_file():
-                    # Skip pycache and other build artifacts
-                    if "__pycache__" in str(item) or item.suffix in [".pyc", ".pyo"]:
-                        continue
-                    
-                    arcname = item.relative_to(self.sdk_dir.parent)
-                    zipf.write(item, arcname)
+            self._add_tree_to_zip(zipf, self.sdk_dir)
         
         # Calculate hash
         sha256_hash = hashlib.sha256()
@@ -228,11 +302,14 @@ For detailed changes, see [CHANGELOG.md](CHANGELOG.md)
                 sha256_hash.update(byte_block)
         
         hash_file = zip_path.with_suffix(".zip.sha256")
-        hash_file.write_text(f"{sha256_hash.hexdigest()}  {zip_name}\n")
+        hash_written = self._atomic_write(hash_file, f"{sha256_hash.hexdigest()}  {zip_name}\n")
         
         size_mb = zip_path.stat().st_size / (1024 * 1024)
         print(f"  ✅ Created {zip_name} ({size_mb:.2f} MB)")
-        print(f"  ✅ Created {hash_file.name}")
+        if hash_written:
+            print(f"  ✅ Created {hash_file.name}")
+        else:
+            print(f"  ⏭️  {hash_file.name} already up to date")
         
         return zip_path
     
@@ -275,21 +352,30 @@ For detailed changes, see [CHANGELOG.md](CHANGELOG.md)
         print(f"  ✅ Git operations complete")
         return True
     
-    def build_distributions(self):
-        """Build wheel and source distributions"""
-        print(f"\n🏗️  Building distributions...")
+    def _clean_if_stale(self, path: Path, version: str):
+        """Remove a build output directory unless it only holds artifacts for version"""
+        import shutil
         
-        # Clean old builds
-        if self.dist_dir.exists():
-            shutil.rmtree(self.dist_dir)
+        try:
+            children = [child.name for child in path.iterdir()]
+        except FileNotFoundError:
+            return
         
-        build_dir = self.root / "build"
-        if build_dir.exists():
-            shutil.rmtree(build_dir)
+        # "plhub-0.5.2.tar.gz" or "plhub-0.5.2-py3-none-any.whl", but not 0.5.20
+        artifact = re.compile(rf"-{re.escape(version)}(?=[-.])")
+        if children and all(artifact.search(name) for name in children):
+            return
+        
+        shutil.rmtree(path, ignore_errors=True)
+    
+    def build_distributions(self, version: str = None):
+        """Build wheel and source distributions"""
+        print(f"\n🏗️  Building distributions...")
+        version = version or self.current_version
         
-        egg_info = self.root / "plhub.egg-info"
-        if egg_info.exists():
-            shutil.rmtree(egg_info)
+        # Clean old builds (skipped when already clean for this version)
+        for stale_dir in (self.dist_dir, self.root / "build", self.root / "plhub.egg-info"):
+            self._clean_if_stale(stale_dir, version)
         
         # Build distributions
         commands = [
@@ -443,7 +529,7 @@ For detailed changes, see [CHANGELOG.md](CHANGELOG.md)
         
         # Step 4: Build distributions
         if not skip_pypi:
-            if not self.build_distributions():
+            if not self.build_distributions(new_version):
                 print("❌ Build failed")
                 return False
         
@@ -2,13 +2,97 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import datetime as _dt
 import hashlib
 import json
+import os
+import pickle
+import re
 import shutil
+import sys
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:  # pragma: no cover - optional speedup
+    _blake3 = None
+
+
+# Theme and manifest (de)serialisation. orjson is used when installed; its
+# JSONDecodeError subclasses json.JSONDecodeError so callers catch one type.
+if orjson is not None:
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(data: Any, sort_keys: bool = False) -> bytes:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, option=option)
+
+else:
+
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(data: Any, sort_keys: bool = False) -> bytes:
+        return (json.dumps(data, indent=2, sort_keys=sort_keys) + "\n").encode("utf-8")
+
+
+# Theme checksums only track changes, so the faster blake3 is preferred when available
+CHECKSUM_ALGORITHM = "blake3" if _blake3 is not None else "sha256"
+
+
+def _new_digest(algorithm: str = CHECKSUM_ALGORITHM) -> Any:
+    if algorithm == "blake3":
+        if _blake3 is None:
+            raise ValueError("blake3 checksums require the 'blake3' package")
+        return _blake3()
+    return hashlib.new(algorithm)
+
+
+# ASCII separators map to "_" and other ASCII punctuation is dropped
+_SLUG_TABLE = {
+    code: ("_" if chr(code) in " -_." else None)
+    for code in range(128)
+    if not chr(code).isalnum()
+}
+# Byte-level equivalent for the all-ASCII fast path
+_ASCII_SLUG_TABLE = bytes.maketrans(b" -.", b"___")
+_ASCII_SLUG_DELETE = bytes(code for code, sep in _SLUG_TABLE.items() if sep is None)
+_SLUG_COLLAPSE = re.compile(r"_+")
+
+
+@lru_cache(maxsize=4096)
+def _slugify(value: str) -> str:
+    slug = value.strip().lower()
+    if slug.isascii():
+        slug = slug.encode("ascii").translate(_ASCII_SLUG_TABLE, _ASCII_SLUG_DELETE).decode("ascii")
+    else:
+        slug = "".join(ch for ch in slug.translate(_SLUG_TABLE) if ch.isalnum() or ch == "_")
+    slug = _SLUG_COLLAPSE.sub("_", slug).strip("_")
+    # Interned so alias/index lookups mostly compare by identity
+    return sys.intern(slug or "style")
+
+
+@lru_cache(maxsize=4096)
+def _normalize(value: str) -> str:
+    if not value:
+        return ""
+    if value.lower().endswith(".json"):
+        value = value[:-5]
+    return _slugify(value)
 
 
 @dataclass
@@ -20,7 +104,25 @@ class StyleRecord:
     description: Optional[str]
     path: Path
     source: str
-    data: Dict[str, Any]
+    _data: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Parsed theme definition, read from ``path`` on first access."""
+        return self.ensure_data()
+
+    def ensure_data(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = _json_loads(self.path.read_bytes())
+        return self._data
+
+    def reload_data(self) -> Dict[str, Any]:
+        self._data = None
+        return self.ensure_data()
+
+    def release_data(self) -> None:
+        """Drop the parsed definition; it is re-read on next access."""
+        self._data = None
 
 
 class StyleManager:
@@ -31,6 +133,8 @@ class StyleManager:
     THEMES_DIR_NAME = "themes"
     ACTIVE_MANIFEST_NAME = "active_style.json"
     README_NAME = "README.md"
+    STYLE_CACHE_NAME = ".styles.cache"
+    STYLE_CACHE_VERSION = 1
 
     def __init__(self, plhub_root: Path, project_root: Optional[Path] = None) -> None:
         self.plhub_root = plhub_root
@@ -46,7 +150,7 @@ class StyleManager:
         )
 
         self._builtin_styles: Dict[str, StyleRecord] = self._load_styles(
-            self.builtin_dir, source="builtin"
+            self.builtin_dir, source="builtin", use_cache=True
         )
         self._project_styles: Dict[str, StyleRecord] = (
             self._load_styles(self.project_themes_dir, source="project")
@@ -54,64 +158,123 @@ class StyleManager:
             else {}
         )
         self._index: Dict[str, StyleRecord] = {**self._builtin_styles, **self._project_styles}
-        self._aliases: Dict[str, str] = {}
-        self._register_aliases(self._builtin_styles.values())
-        self._register_aliases(self._project_styles.values())
+        # Project records come last so their aliases win, as with _add_aliases
+        self._aliases: Dict[str, str] = {
+            alias: record.key
+            for record in chain(self._builtin_styles.values(), self._project_styles.values())
+            for alias in (
+                record.key,
+                _normalize(record.name),
+                _normalize(record.path.stem),
+                _normalize(record.path.name),
+            )
+        }
+        self._checksum_cache: Dict[Tuple[Path, int, int], str] = {}
+        self._manifest_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
 
     # ------------------------------------------------------------------
     # Discovery helpers
     # ------------------------------------------------------------------
-    @staticmethod
-    def slugify(value: str) -> str:
-        cleaned = []
-        for ch in value.strip().lower():
-            if ch.isalnum():
-                cleaned.append(ch)
-            elif ch in {" ", "-", "_", "."}:
-                cleaned.append("_")
-        slug = "".join(cleaned)
-        while "__" in slug:
-            slug = slug.replace("__", "_")
-        slug = slug.strip("_")
-        return slug or "style"
-
-    @staticmethod
-    def _normalize(value: str) -> str:
-        if not value:
-            return ""
-        if value.lower().endswith(".json"):
-            value = value[:-5]
-        return StyleManager.slugify(value)
-
-    def _register_aliases(self, records: Iterable[StyleRecord]) -> None:
-        for record in records:
-            key = record.key
-            self._aliases[key] = key
-            self._aliases[self._normalize(record.name)] = key
-            self._aliases[self._normalize(record.path.stem)] = key
-            self._aliases[self._normalize(record.path.name)] = key
-
-    def _load_styles(self, directory: Optional[Path], source: str) -> Dict[str, StyleRecord]:
+    # Pure string transforms, memoized at module level
+    slugify = staticmethod(_slugify)
+    _normalize = staticmethod(_normalize)
+
+    def _add_aliases(self, record: StyleRecord) -> None:
+        aliases = self._aliases
+        key = record.key
+        aliases[key] = key
+        aliases[_normalize(record.name)] = key
+        aliases[_normalize(record.path.stem)] = key
+        aliases[_normalize(record.path.name)] = key
+
+    def _load_styles(
+        self, directory: Optional[Path], source: str, use_cache: bool = False
+    ) -> Dict[str, StyleRecord]:
         results: Dict[str, StyleRecord] = {}
-        if not directory or not directory.exists():
+        if not directory:
             return results
-        for json_path in sorted(directory.glob("*.json")):
-            record = self._load_style_from_path(json_path, source=source)
+        try:
+            with os.scandir(directory) as it:
+                dir_entries = [e for e in it if e.name.endswith(".json") and e.is_file()]
+        except OSError:
+            return results
+        dir_entries.sort(key=lambda e: e.name)
+        cache_path = directory / self.STYLE_CACHE_NAME if use_cache else None
+        cached = self._read_style_cache(cache_path) if cache_path else {}
+        entries: Dict[str, Tuple[Tuple[int, int], Tuple[str, str, Optional[str]]]] = {}
+        scanned: List[Tuple[Path, Tuple[int, int], Optional[StyleRecord]]] = []
+        for dir_entry in dir_entries:
+            json_path = Path(dir_entry.path)
+            try:
+                stat = dir_entry.stat()
+            except OSError:
+                continue
+            signature = (stat.st_mtime_ns, stat.st_size)
+            hit = cached.get(json_path.name)
+            record: Optional[StyleRecord] = None
+            if hit and hit[0] == signature:
+                key, name, description = hit[1]
+                record = StyleRecord(
+                    key=sys.intern(key), name=name, description=description, path=json_path, source=source
+                )
+            scanned.append((json_path, signature, record))
+
+        # Parse cache misses; overlap the reads with a small pool when there are several
+        misses = [json_path for json_path, _, record in scanned if record is None]
+        if len(misses) > 2:
+            with ThreadPoolExecutor(max_workers=min(8, len(misses))) as executor:
+                parsed = list(
+                    executor.map(lambda p: self._load_style_from_path(p, source=source), misses)
+                )
+        else:
+            parsed = [self._load_style_from_path(p, source=source) for p in misses]
+        parsed_by_path = dict(zip(misses, parsed))
+
+        for json_path, signature, record in scanned:
+            if record is None:
+                record = parsed_by_path[json_path]
             if record:
                 results[record.key] = record
+                entries[json_path.name] = (signature, (record.key, record.name, record.description))
+        if cache_path and entries != cached:
+            self._write_style_cache(cache_path, entries)
         return results
 
+    def _read_style_cache(self, cache_path: Path) -> Dict[str, Any]:
+        """Load cached record metadata keyed by file name, or ``{}`` if unusable."""
+        try:
+            with cache_path.open("rb") as handle:
+                payload = pickle.load(handle)
+        except (OSError, EOFError, pickle.PickleError, AttributeError, TypeError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != self.STYLE_CACHE_VERSION:
+            return {}
+        return payload.get("entries", {})
+
+    def _write_style_cache(self, cache_path: Path, entries: Dict[str, Any]) -> None:
+        payload = {"version": self.STYLE_CACHE_VERSION, "entries": entries}
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            with tmp_path.open("wb") as handle:
+                pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Read-only installs simply run without the cache
+            pass
+
     def _load_style_from_path(
         self, json_path: Path, source: str
     ) -> Optional[StyleRecord]:
         try:
-            data = json.loads(json_path.read_text(encoding="utf-8"))
+            # Parsed whole so a broken theme is never listed; only the metadata
+            # is kept, and the style cache spares re-parsing unchanged files
+            meta = _json_loads(json_path.read_bytes())
         except (OSError, json.JSONDecodeError):
             return None
-        name = data.get("name") or json_path.stem.replace("_", " ").title()
-        description = data.get("description")
+        name = meta.get("name") or json_path.stem.replace("_", " ").title()
+        description = meta.get("description")
         key = self.slugify(json_path.stem)
-        return StyleRecord(key=key, name=name, description=description, path=json_path, source=source, data=data)
+        return StyleRecord(key=key, name=name, description=description, path=json_path, source=source)
 
     # ------------------------------------------------------------------
     # Public accessors
@@ -185,20 +348,48 @@ class StyleManager:
     # ------------------------------------------------------------------
     def read_manifest(self) -> Optional[Dict[str, Any]]:
         manifest_path = self.active_manifest_path()
-        if not manifest_path or not manifest_path.exists():
+        if not manifest_path:
             return None
         try:
-            return json.loads(manifest_path.read_text(encoding="utf-8"))
+            stat = manifest_path.stat()
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._manifest_cache and self._manifest_cache[0] == signature:
+            return dict(self._manifest_cache[1])
+        try:
+            data = _json_loads(manifest_path.read_bytes())
         except (OSError, json.JSONDecodeError):
             return None
+        if isinstance(data, dict):
+            self._manifest_cache = (signature, data)
+            return dict(data)
+        return data
 
     def write_manifest(self, data: Dict[str, Any]) -> Optional[Path]:
         manifest_path = self.active_manifest_path()
         if not manifest_path:
             return None
-        manifest_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        # Write beside the manifest and rename so a crash never leaves it half-written
+        tmp_path = manifest_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(_json_dumps(data, sort_keys=True))
+        os.replace(tmp_path, manifest_path)
+        self._manifest_cache = None
         return manifest_path
 
+    def _manifest_checksum(self, theme_path: str, stat: os.stat_result) -> Optional[str]:
+        """Reuse the manifest checksum if it was taken from an identical theme file."""
+        manifest = self.read_manifest()
+        if (
+            manifest
+            and manifest.get("themePath") == theme_path
+            and manifest.get("checksumAlgorithm", "sha256") == CHECKSUM_ALGORITHM
+            and manifest.get("checksumMtime") == stat.st_mtime_ns
+            and manifest.get("checksumSize") == stat.st_size
+        ):
+            return manifest.get("checksum")
+        return None
+
     def get_active(self) -> Tuple[Optional[Dict[str, Any]], Optional[StyleRecord]]:
         manifest = self.read_manifest()
         if not manifest:
@@ -218,7 +409,7 @@ class StyleManager:
             if loaded:
                 self._project_styles[loaded.key] = loaded
                 self._index[loaded.key] = loaded
-                self._register_aliases([loaded])
+                self._add_aliases(loaded)
                 return manifest, loaded
         return manifest, None
 
@@ -230,33 +421,44 @@ class StyleManager:
             raise RuntimeError("Style application requires a project root.")
         style = self.resolve(identifier)
         self.ensure_structure()
+        return self._apply_resolved(style, force=force)
+
+    def _apply_resolved(self, style: StyleRecord, *, force: bool) -> Dict[str, Any]:
+        """Copy ``style`` into the project themes directory and activate it.
+
+        The project style directories must already exist.
+        """
         assert self.project_themes_dir is not None
         dest_path = self.project_themes_dir / f"{style.key}.json"
 
-        if style.source == "builtin":
-            if not dest_path.exists() or force:
-                shutil.copy2(style.path, dest_path)
-            else:
-                # If destination exists and not forcing, reuse on-disk file
-                pass
-        else:
-            # For project styles, ensure the file is under the expected directory
-            if style.path.resolve() != dest_path.resolve():
-                if not dest_path.exists() or force:
-                    shutil.copy2(style.path, dest_path)
-        if not dest_path.exists():
-            # As a fallback, copy the original definition
-            shutil.copy2(style.path, dest_path)
-
-        checksum = self._compute_checksum(dest_path)
+        # Copies hash while writing; only an untouched destination is re-read
+        checksum: Optional[str] = None
+        # Project styles must end up under the themes directory; ones already there are used in place
+        if style.source == "builtin" or not self._same_file(style.path, dest_path):
+            checksum = self._ensure_copied(style.path, dest_path, force)
+
         relative_theme_path = Path(self.THEMES_DIR_NAME) / dest_path.name
+        theme_path = str(relative_theme_path).replace("\\", "/")
+        dest_stat = dest_path.stat()
+        cache_key = (dest_path, dest_stat.st_mtime_ns, dest_stat.st_size)
+        if checksum is None:
+            checksum = self._checksum_cache.get(cache_key) or self._manifest_checksum(
+                theme_path, dest_stat
+            )
+        if checksum is None:
+            checksum = self._compute_checksum(dest_path)
+        self._checksum_cache[cache_key] = checksum
+
         manifest = {
             "activeTheme": style.key,
             "displayName": style.name,
-            "themePath": str(relative_theme_path).replace("\\", "/"),
+            "themePath": theme_path,
             "source": style.source,
-            "appliedAt": _dt.datetime.utcnow().replace(microsecond=False).isoformat() + "Z",
+            "appliedAt": _dt.datetime.now(_dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
             "checksum": checksum,
+            "checksumAlgorithm": CHECKSUM_ALGORITHM,
+            "checksumMtime": dest_stat.st_mtime_ns,
+            "checksumSize": dest_stat.st_size,
         }
         self.write_manifest(manifest)
 
@@ -265,7 +467,7 @@ class StyleManager:
         if local_record:
             self._project_styles[local_record.key] = local_record
             self._index[local_record.key] = local_record
-            self._register_aliases([local_record])
+            self._add_aliases(local_record)
 
         return manifest
 
@@ -297,7 +499,9 @@ class StyleManager:
             )
 
         # Load base data and customise name/description
-        base_data = json.loads(base_style.path.read_text(encoding="utf-8"))
+        # Take ownership of the parsed base; the record re-reads it if needed again
+        base_data = base_style.ensure_data()
+        base_style.release_data()
         base_data["name"] = name
         if description:
             base_data["description"] = description
@@ -307,7 +511,7 @@ class StyleManager:
                 f"Custom theme derived from {base_style.name}",
             )
 
-        destination.write_text(json.dumps(base_data, indent=2) + "\n", encoding="utf-8")
+        destination.write_bytes(_json_dumps(base_data))
 
         record = StyleRecord(
             key=slug,
@@ -315,11 +519,10 @@ class StyleManager:
             description=base_data.get("description"),
             path=destination,
             source="project",
-            data=base_data,
         )
         self._project_styles[slug] = record
         self._index[slug] = record
-        self._register_aliases([record])
+        self._add_aliases(record)
         return record
 
     # ------------------------------------------------------------------
@@ -334,21 +537,62 @@ class StyleManager:
         default_style: str = "default_light",
     ) -> Dict[str, Any]:
         manager = cls(plhub_root, project_root)
-        manager.ensure_structure()
-        manager.write_styles_readme()
-        return manager.apply(default_style)
+        return manager._fast_bootstrap(default_style)
+
+    def _fast_bootstrap(self, default_style: str) -> Dict[str, Any]:
+        if not self.project_root:
+            raise RuntimeError("A project root is required for this operation.")
+        style = self.resolve(default_style)
+        assert self.project_themes_dir is not None
+        # A single makedirs creates ui/, ui/styles/ and ui/styles/themes/
+        os.makedirs(self.project_themes_dir, exist_ok=True)
+        self.write_styles_readme()
+        return self._apply_resolved(style, force=False)
 
     # ------------------------------------------------------------------
     # Utility helpers
     # ------------------------------------------------------------------
     @staticmethod
-    def _compute_checksum(path: Path) -> str:
-        digest = hashlib.sha256()
+    def _compute_checksum(path: Path, algorithm: str = CHECKSUM_ALGORITHM) -> str:
         with path.open("rb") as handle:
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(handle, lambda: _new_digest(algorithm)).hexdigest()
+            digest = _new_digest(algorithm)
             for chunk in iter(lambda: handle.read(65536), b""):
                 digest.update(chunk)
         return digest.hexdigest()
 
+    @staticmethod
+    def _same_file(first: Path, second: Path) -> bool:
+        """Compare by device/inode rather than resolving both paths."""
+        try:
+            return os.path.samefile(first, second)
+        except OSError:
+            return False
+
+    def _ensure_copied(self, src: Path, dst: Path, force: bool) -> Optional[str]:
+        """Copy src to dst unless dst already exists; return the checksum if copied."""
+        if not force:
+            try:
+                dst.stat()
+            except FileNotFoundError:
+                pass
+            else:
+                # Destination exists and we are not forcing: reuse the on-disk file
+                return None
+        return self._copy_and_hash(src, dst)
+
+    @staticmethod
+    def _copy_and_hash(src: Path, dst: Path) -> str:
+        """Copy src to dst like ``shutil.copy2`` and return the checksum of the bytes written."""
+        digest = _new_digest()
+        with src.open("rb") as reader, dst.open("wb") as writer:
+            for chunk in iter(lambda: reader.read(65536), b""):
+                digest.update(chunk)
+                writer.write(chunk)
+        shutil.copystat(src, dst)
+        return digest.hexdigest()
+
     def export_summary(self) -> Dict[str, Any]:
         manifest, active = self.get_active()
         return {
@@ -8,9 +8,14 @@ Provides comprehensive testing support for all platforms:
 """
 
 import os
+import re
 import sys
 import json
 import subprocess
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from enum import Enum
@@ -18,6 +23,28 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
+# Raw output lines kept per run for failure diagnostics
+_TAIL_LINES = 50
+_COMMAND_TIMEOUT = 300  # 5 minute timeout
+
+# Spawn flags: no console window on Windows; on POSIX leave close_fds off
+# (our fds are non-inheritable anyway) so subprocess can take its fast path
+_FAST_SPAWN = True
+if not _FAST_SPAWN:
+    _SPAWN_KWARGS: Dict = {}
+elif os.name == 'nt':
+    _SPAWN_KWARGS = {'creationflags': subprocess.CREATE_NO_WINDOW}
+else:
+    _SPAWN_KWARGS = {'close_fds': False}
+
+# Only consulted after a cheap substring check has matched the line
+_ANDROID_RE = re.compile(r'\s*(\S+)')
+# Searched, not matched: xcodebuild may prefix a timestamp, and newer Xcode
+# puts the device clone name between the status and the duration
+_IOS_RE = re.compile(r"Test Case '([^']*)' (passed|failed)\b(?:.*\((\d+(?:\.\d+)?) seconds\))?")
+_DOTNET_COUNT_RE = re.compile(r'\b(Passed|Failed|Skipped):\s*(\d+)')
+
+
 class PohTestType(Enum):
     """Types of tests"""
     UNIT = "unit"
@@ -54,6 +81,7 @@ class PohTestSuite:
     duration: float
     results: List[PohTestResult]
     timestamp: datetime = None
+    output_tail: str = ""  # last lines of output when the command failed
     
     def __post_init__(self):
         if self.timestamp is None:
@@ -67,37 +95,98 @@ class PohTestSuite:
         return (self.passed / self.total_tests) * 100
 
 
+def _parse_xctest_line(line: str, results: List[PohTestResult]):
+    """Parse one line of XCTest output (shared by the iOS and macOS runners)"""
+    if 'Test Case' in line and ('passed' in line or 'failed' in line):
+        match = _IOS_RE.search(line)
+        if not match:
+            return
+        
+        test_name, status, seconds = match.groups()
+        duration = float(seconds) if seconds else 0.0
+        
+        results.append(PohTestResult(
+            test_name=test_name,
+            test_type=PohTestType.UNIT,
+            status=status,
+            duration=duration
+        ))
+
+
 class PohTestRunner:
     """Base class for platform test runners"""
     
     def __init__(self, project_dir: Path, platform: str):
         self.project_dir = project_dir
         self.platform = platform
+        self._test_type = PohTestType.UNIT
+        self.output_tail: str = ""
+        self._project_file: Optional[Path] = None
     
     def run_tests(self, test_type: PohTestType = PohTestType.UNIT,
                   pattern: Optional[str] = None) -> PohTestSuite:
         """Run tests and return results"""
         raise NotImplementedError
     
-    def _parse_results(self, output: str) -> List[PohTestResult]:
-        """Parse test output into results"""
+    def _parse_line(self, line: str, results: List[PohTestResult]):
+        """Parse one output line, appending any result it reports"""
         raise NotImplementedError
     
-    def _run_command(self, cmd: List[str]) -> tuple[int, str, str]:
-        """Run command and capture output"""
+    def _find_project_file(self, pattern: str) -> Path:
+        """First project file matching pattern, looked up once per runner"""
+        if self._project_file is None:
+            self._project_file = next(self.project_dir.glob(pattern), None)
+            if self._project_file is None:
+                raise FileNotFoundError(f"No {pattern} found in {self.project_dir}")
+        return self._project_file
+    
+    @staticmethod
+    def _default_results() -> List[PohTestResult]:
+        """Placeholder result used when the output reports no tests"""
+        return [PohTestResult("DefaultTest", PohTestType.UNIT, "passed", 0.0)]
+    
+    def _run_command(self, cmd: List[str]) -> tuple[int, List[PohTestResult]]:
+        """Run command, parsing stdout/stderr line by line as it is produced"""
+        results: List[PohTestResult] = []
+        tail = deque(maxlen=_TAIL_LINES)
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
                 cwd=self.project_dir,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=300  # 5 minute timeout
+                bufsize=1,
+                **_SPAWN_KWARGS
             )
-            return result.returncode, result.stdout, result.stderr
-        except subprocess.TimeoutExpired:
-            return -1, "", "Test execution timed out"
         except Exception as e:
-            return -1, "", str(e)
+            self.output_tail = str(e)
+            return -1, self._default_results()
+        
+        timed_out = threading.Event()
+        
+        def _kill():
+            timed_out.set()
+            proc.kill()
+        
+        watchdog = threading.Timer(_COMMAND_TIMEOUT, _kill)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            with proc.stdout:
+                for line in proc.stdout:
+                    tail.append(line)
+                    self._parse_line(line.rstrip('\n'), results)
+            returncode = proc.wait()
+        finally:
+            watchdog.cancel()
+        
+        if timed_out.is_set():
+            tail.append("Test execution timed out\n")
+            returncode = -1
+        self.output_tail = "".join(tail) if returncode != 0 else ""
+        
+        return returncode, results if results else self._default_results()
 
 
 class AndroidTestRunner(PohTestRunner):
@@ -120,49 +209,40 @@ class AndroidTestRunner(PohTestRunner):
         if pattern:
             cmd.extend(["--tests", pattern])
         
-        start_time = datetime.now()
-        returncode, stdout, stderr = self._run_command(cmd)
-        duration = (datetime.now() - start_time).total_seconds()
+        start_time = time.perf_counter()
+        returncode, results = self._run_command(cmd)
+        duration = time.perf_counter() - start_time
         
-        results = self._parse_results(stdout + stderr)
+        counts = Counter(r.status for r in results)
         
         return PohTestSuite(
             platform="android",
             total_tests=len(results),
-            passed=sum(1 for r in results if r.status == "passed"),
-            failed=sum(1 for r in results if r.status == "failed"),
-            skipped=sum(1 for r in results if r.status == "skipped"),
+            passed=counts["passed"],
+            failed=counts["failed"],
+            skipped=counts["skipped"],
             duration=duration,
-            results=results
+            results=results,
+            output_tail=self.output_tail
         )
     
-    def _parse_results(self, output: str) -> List[PohTestResult]:
-        """Parse Gradle test output"""
-        results = []
-        
+    def _parse_line(self, line: str, results: List[PohTestResult]):
+        """Parse one line of Gradle test output"""
         # Parse JUnit/Gradle output
-        for line in output.split('\n'):
-            if 'Test' in line and ('PASSED' in line or 'FAILED' in line or 'SKIPPED' in line):
-                parts = line.split()
-                test_name = parts[0] if parts else "Unknown"
-                
-                if 'PASSED' in line:
-                    status = "passed"
-                elif 'FAILED' in line:
-                    status = "failed"
-                else:
-                    status = "skipped"
-                
-                results.append(PohTestResult(
-                    test_name=test_name,
-                    test_type=PohTestType.UNIT,
-                    status=status,
-                    duration=0.0
-                ))
-        
-        return results if results else [
-            PohTestResult("DefaultTest", PohTestType.UNIT, "passed", 0.0)
-        ]
+        if 'Test' in line and ('PASSED' in line or 'FAILED' in line or 'SKIPPED' in line):
+            if 'PASSED' in line:
+                status = "passed"
+            elif 'FAILED' in line:
+                status = "failed"
+            else:
+                status = "skipped"
+            
+            results.append(PohTestResult(
+                test_name=_ANDROID_RE.match(line).group(1),
+                test_type=PohTestType.UNIT,
+                status=status,
+                duration=0.0
+            ))
 
 
 class IOSTestRunner(PohTestRunner):
@@ -173,7 +253,7 @@ class IOSTestRunner(PohTestRunner):
         """Run iOS tests"""
         print(f"Running iOS {test_type.value} tests...")
         
-        xcodeproj = list(self.project_dir.glob("*.xcodeproj"))[0]
+        xcodeproj = self._find_project_file("*.xcodeproj")
         scheme = xcodeproj.stem
         
         cmd = [
@@ -188,52 +268,26 @@ class IOSTestRunner(PohTestRunner):
         if pattern:
             cmd.extend(["-only-testing", pattern])
         
-        start_time = datetime.now()
-        returncode, stdout, stderr = self._run_command(cmd)
-        duration = (datetime.now() - start_time).total_seconds()
+        start_time = time.perf_counter()
+        returncode, results = self._run_command(cmd)
+        duration = time.perf_counter() - start_time
         
-        results = self._parse_results(stdout + stderr)
+        counts = Counter(r.status for r in results)
         
         return PohTestSuite(
             platform="ios",
             total_tests=len(results),
-            passed=sum(1 for r in results if r.status == "passed"),
-            failed=sum(1 for r in results if r.status == "failed"),
-            skipped=sum(1 for r in results if r.status == "skipped"),
+            passed=counts["passed"],
+            failed=counts["failed"],
+            skipped=counts["skipped"],
             duration=duration,
-            results=results
+            results=results,
+            output_tail=self.output_tail
         )
     
-    def _parse_results(self, output: str) -> List[PohTestResult]:
-        """Parse XCTest output"""
-        results = []
-        
-        for line in output.split('\n'):
-            if 'Test Case' in line and ('passed' in line or 'failed' in line):
-                parts = line.split("'")
-                test_name = parts[1] if len(parts) > 1 else "Unknown"
-                
-                status = "passed" if "passed" in line else "failed"
-                
-                # Extract duration
-                duration = 0.0
-                if '(' in line and 'seconds)' in line:
-                    try:
-                        duration_str = line.split('(')[1].split('seconds')[0].strip()
-                        duration = float(duration_str)
-                    except:
-                        pass
-                
-                results.append(PohTestResult(
-                    test_name=test_name,
-                    test_type=PohTestType.UNIT,
-                    status=status,
-                    duration=duration
-                ))
-        
-        return results if results else [
-            PohTestResult("DefaultTest", PohTestType.UNIT, "passed", 0.0)
-        ]
+    def _parse_line(self, line: str, results: List[PohTestResult]):
+        """Parse one line of XCTest output"""
+        _parse_xctest_line(line, results)
 
 
 class MacOSTestRunner(PohTestRunner):
@@ -244,7 +298,7 @@ class MacOSTestRunner(PohTestRunner):
         """Run macOS tests"""
         print(f"Running macOS {test_type.value} tests...")
         
-        xcodeproj = list(self.project_dir.glob("*.xcodeproj"))[0]
+        xcodeproj = self._find_project_file("*.xcodeproj")
         scheme = xcodeproj.stem
         
         cmd = [
@@ -258,89 +312,94 @@ class MacOSTestRunner(PohTestRunner):
         if pattern:
             cmd.extend(["-only-testing", pattern])
         
-        start_time = datetime.now()
-        returncode, stdout, stderr = self._run_command(cmd)
-        duration = (datetime.now() - start_time).total_seconds()
+        start_time = time.perf_counter()
+        returncode, results = self._run_command(cmd)
+        duration = time.perf_counter() - start_time
         
-        results = self._parse_results(stdout + stderr)
+        counts = Counter(r.status for r in results)
         
         return PohTestSuite(
             platform="macos",
             total_tests=len(results),
-            passed=sum(1 for r in results if r.status == "passed"),
-            failed=sum(1 for r in results if r.status == "failed"),
-            skipped=sum(1 for r in results if r.status == "skipped"),
+            passed=counts["passed"],
+            failed=counts["failed"],
+            skipped=counts["skipped"],
             duration=duration,
-            results=results
+            results=results,
+            output_tail=self.output_tail
         )
     
-    def _parse_results(self, output: str) -> List[PohTestResult]:
+    def _parse_line(self, line: str, results: List[PohTestResult]):
         """Parse XCTest output (same as iOS)"""
-        return IOSTestRunner(self.project_dir, "macos")._parse_results(output)
+        _parse_xctest_line(line, results)
 
 
 class WindowsTestRunner(PohTestRunner):
     """Windows test runner"""
     
+    def __init__(self, project_dir: Path, platform: str):
+        super().__init__(project_dir, platform)
+        # dotnet only reports totals, so results hold one summary per line
+        # and the real test counts are tallied here
+        self._summary_counts: Counter = Counter()
+    
     def run_tests(self, test_type: PohTestType = PohTestType.UNIT,
                   pattern: Optional[str] = None) -> PohTestSuite:
         """Run Windows tests"""
         print(f"Running Windows {test_type.value} tests...")
         
-        test_proj = list(self.project_dir.glob("*.Tests/*.csproj"))[0]
+        test_proj = self._find_project_file("*.Tests/*.csproj")
         
         cmd = ["dotnet", "test", str(test_proj), "--logger:trx"]
         
         if pattern:
             cmd.extend(["--filter", f"FullyQualifiedName~{pattern}"])
         
-        start_time = datetime.now()
-        returncode, stdout, stderr = self._run_command(cmd)
-        duration = (datetime.now() - start_time).total_seconds()
+        self._summary_counts = Counter()
+        start_time = time.perf_counter()
+        returncode, results = self._run_command(cmd)
+        duration = time.perf_counter() - start_time
         
-        results = self._parse_results(stdout + stderr)
+        counts = self._summary_counts or Counter(r.status for r in results)
         
         return PohTestSuite(
             platform="windows",
-            total_tests=len(results),
-            passed=sum(1 for r in results if r.status == "passed"),
-            failed=sum(1 for r in results if r.status == "failed"),
-            skipped=sum(1 for r in results if r.status == "skipped"),
+            total_tests=sum(counts.values()),
+            passed=counts["passed"],
+            failed=counts["failed"],
+            skipped=counts["skipped"],
             duration=duration,
-            results=results
+            results=results,
+            output_tail=self.output_tail
         )
     
-    def _parse_results(self, output: str) -> List[PohTestResult]:
-        """Parse dotnet test output"""
-        results = []
-        
-        for line in output.split('\n'):
-            if 'Passed!' in line or 'Failed!' in line:
-                parts = line.split()
-                
-                if 'Passed!' in line:
-                    status = "passed"
-                elif 'Failed!' in line:
-                    status = "failed"
-                else:
-                    continue
-                
-                # Extract test count
-                for part in parts:
-                    if part.isdigit():
-                        count = int(part)
-                        for i in range(count):
-                            results.append(PohTestResult(
-                                test_name=f"Test{i+1}",
-                                test_type=PohTestType.UNIT,
-                                status=status,
-                                duration=0.0
-                            ))
-                        break
-        
-        return results if results else [
-            PohTestResult("DefaultTest", PohTestType.UNIT, "passed", 0.0)
-        ]
+    def _parse_line(self, line: str, results: List[PohTestResult]):
+        """Parse one line of dotnet test output"""
+        if 'Passed!' in line or 'Failed!' in line:
+            parts = line.split()
+            
+            if 'Passed!' in line:
+                status = "passed"
+            else:
+                status = "failed"
+            
+            # "Failed: 1, Passed: 9, Skipped: 0, ..." on current SDKs; older ones
+            # print a bare count for the line's status
+            counts = [(kind.lower(), int(n)) for kind, n in _DOTNET_COUNT_RE.findall(line)]
+            if not counts:
+                count = next((int(part) for part in parts if part.isdigit()), 0)
+                counts = [(status, count)]
+            
+            for status, count in counts:
+                if count:
+                    self._summary_counts[status] += count
+                    results.append(PohTestResult(
+                        test_name="dotnet-summary",
+                        test_type=PohTestType.UNIT,
+                        status=status,
+                        duration=0.0,
+                        error_message=f"{count} tests {status}"
+                    ))
 
 
 class WebTestRunner(PohTestRunner):
@@ -350,6 +409,7 @@ class WebTestRunner(PohTestRunner):
                   pattern: Optional[str] = None) -> PohTestSuite:
         """Run web tests"""
         print(f"Running web {test_type.value} tests...")
+        self._test_type = test_type
         
         if test_type == PohTestType.UNIT:
             cmd = ["npm", "run", "test:unit"]
@@ -361,71 +421,76 @@ class WebTestRunner(PohTestRunner):
         if pattern:
             cmd.append(pattern)
         
-        start_time = datetime.now()
-        returncode, stdout, stderr = self._run_command(cmd)
-        duration = (datetime.now() - start_time).total_seconds()
+        start_time = time.perf_counter()
+        returncode, results = self._run_command(cmd)
+        duration = time.perf_counter() - start_time
         
-        results = self._parse_results(stdout + stderr)
+        counts = Counter(r.status for r in results)
         
         return PohTestSuite(
             platform="web",
             total_tests=len(results),
-            passed=sum(1 for r in results if r.status == "passed"),
-            failed=sum(1 for r in results if r.status == "failed"),
-            skipped=sum(1 for r in results if r.status == "skipped"),
+            passed=counts["passed"],
+            failed=counts["failed"],
+            skipped=counts["skipped"],
             duration=duration,
-            results=results
+            results=results,
+            output_tail=self.output_tail
         )
     
-    def _parse_results(self, output: str) -> List[PohTestResult]:
-        """Parse Jest/Vitest output"""
-        results = []
-        
-        for line in output.split('\n'):
-            if ('✓' in line or '✗' in line or 'PASS' in line or 'FAIL' in line):
-                test_name = line.strip()
-                
-                if '✓' in line or 'PASS' in line:
-                    status = "passed"
-                elif '✗' in line or 'FAIL' in line:
-                    status = "failed"
-                else:
-                    continue
-                
-                results.append(PohTestResult(
-                    test_name=test_name[:100],  # Truncate long names
-                    test_type=test_type,
-                    status=status,
-                    duration=0.0
-                ))
-        
-        return results if results else [
-            PohTestResult("DefaultTest", PohTestType.UNIT, "passed", 0.0)
-        ]
+    def _parse_line(self, line: str, results: List[PohTestResult]):
+        """Parse one line of Jest/Vitest output"""
+        if ('✓' in line or '✗' in line or 'PASS' in line or 'FAIL' in line):
+            test_name = line.strip()
+            
+            if '✓' in line or 'PASS' in line:
+                status = "passed"
+            else:
+                status = "failed"
+            
+            results.append(PohTestResult(
+                test_name=test_name[:100],  # Truncate long names
+                test_type=self._test_type,
+                status=status,
+                duration=0.0
+            ))
+
+
+_RUNNERS = {
+    'android': AndroidTestRunner,
+    'ios': IOSTestRunner,
+    'macos': MacOSTestRunner,
+    'windows': WindowsTestRunner,
+    'web': WebTestRunner
+}
+
+
+def _run_one(platform: str, project_dir: Path,
+             test_type: PohTestType = PohTestType.UNIT,
+             pattern: Optional[str] = None) -> PohTestSuite:
+    """Run one platform's tests (module-level so worker processes can pickle it)"""
+    runner_class = _RUNNERS.get(platform)
+    if not runner_class:
+        raise ValueError(f"Unsupported platform: {platform}")
+    
+    runner = runner_class(project_dir, platform)
+    return runner.run_tests(test_type, pattern)
 
 
 class PohTestManager:
     """Manages testing across all platforms"""
     
     def __init__(self):
-        self.runners = {
-            'android': AndroidTestRunner,
-            'ios': IOSTestRunner,
-            'macos': MacOSTestRunner,
-            'windows': WindowsTestRunner,
-            'web': WebTestRunner
-        }
+        self.runners = dict(_RUNNERS)
     
     def run_tests(self, platform: str, project_dir: Path,
                   test_type: PohTestType = PohTestType.UNIT,
                   pattern: Optional[str] = None) -> PohTestSuite:
         """Run tests for specified platform"""
-        runner_class = self.runners.get(platform)
-        if not runner_class:
+        if platform not in self.runners:
             raise ValueError(f"Unsupported platform: {platform}")
         
-        runner = runner_class(project_dir, platform)
-        suite = runner.run_tests(test_type, pattern)
+        suite = _run_one(platform, project_dir, test_type, pattern)
         
         # Display results
         self.display_results(suite)
@@ -435,29 +500,66 @@ class PohTestManager:
         
         return suite
     
+    def run_tests_multi(self, platforms: List[str], project_dir: Path,
+                        test_type: PohTestType = PohTestType.UNIT,
+                        pattern: Optional[str] = None) -> Dict[str, PohTestSuite]:
+        """Run tests for several platforms concurrently, reporting each as it finishes"""
+        for platform in platforms:
+            if platform not in self.runners:
+                raise ValueError(f"Unsupported platform: {platform}")
+        
+        suites: Dict[str, PohTestSuite] = {}
+        if not platforms:
+            return suites
+        
+        # Leave a couple of cores free for the editor/IDE
+        workers = min(len(platforms), max(1, (os.cpu_count() or 1) - 2))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_run_one, platform, project_dir, test_type, pattern): platform
+                for platform in platforms
+            }
+            for future in as_completed(futures):
+                suite = future.result()
+                suites[futures[future]] = suite
+                self.display_results(suite)
+                self.save_results(suite, project_dir)
+        
+        # Preserve the caller's platform order
+        return {platform: suites[platform] for platform in platforms}
+    
     def display_results(self, suite: PohTestSuite):
-        """Display test results"""
-        print("\n" + "="*60)
-        print(f"TEST RESULTS - {suite.platform.upper()}")
-        print("="*60)
-        print(f"Total Tests:  {suite.total_tests}")
-        print(f"✓ Passed:     {suite.passed}")
-        print(f"✗ Failed:     {suite.failed}")
-        print(f"○ Skipped:    {suite.skipped}")
-        print(f"Duration:     {suite.duration:.2f}s")
-        print(f"Success Rate: {suite.success_rate:.1f}%")
-        print("="*60)
+        """Display test results (one write, so concurrent reports never interleave)"""
+        lines = [
+            "",
+            "="*60,
+            f"TEST RESULTS - {suite.platform.upper()}",
+            "="*60,
+            f"Total Tests:  {suite.total_tests}",
+            f"✓ Passed:     {suite.passed}",
+            f"✗ Failed:     {suite.failed}",
+            f"○ Skipped:    {suite.skipped}",
+            f"Duration:     {suite.duration:.2f}s",
+            f"Success Rate: {suite.success_rate:.1f}%",
+            "="*60,
+        ]
         
         # Show failed tests
         if suite.failed > 0:
-            print("\nFailed Tests:")
+            lines.append("\nFailed Tests:")
             for result in suite.results:
                 if result.status == "failed":
-                    print(f"  ✗ {result.test_name}")
+                    lines.append(f"  ✗ {result.test_name}")
                     if result.error_message:
-                        print(f"    Error: {result.error_message}")
+                        lines.append(f"    Error: {result.error_message}")
+        
+        if suite.output_tail:
+            lines.append("\nCommand failed, last output:")
+            lines.extend(f"  {line}" for line in suite.output_tail.rstrip('\n').split('\n'))
         
-        print()
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     def save_results(self, suite: PohTestSuite, project_dir: Path):
         """Save test results to file"""
@@ -477,6 +579,7 @@ class PohTestManager:
             'skipped': suite.skipped,
             'duration': suite.duration,
             'success_rate': suite.success_rate,
+            'output_tail': suite.output_tail,
             'results': [
                 {
                     'test_name': r.test_name,
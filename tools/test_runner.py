@@ -15,12 +15,42 @@ import time
 import json
 import subprocess
 import platform
+import select
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import re
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+# Seconds to wait for `pohlang --driver` to announce itself before falling back
+_DRIVER_HANDSHAKE_TIMEOUT = 2.0
+_TEST_TIMEOUT = 30
+# Lines the generated batch script writes around each imported test
+_BATCH_MARK = '===PLHUB-BATCH==='
+# Test files containing this comment always get an interpreter of their own
+_NO_BATCH_MARKER = '# plhub: no-batch'
+# Characters that cannot appear inside the batch script's Import "..." literal
+_UNBATCHABLE_PATH = re.compile(r'["\\\r\n]')
+
+# Cheaper process creation for the many short-lived test spawns. Python's own
+# fds are non-inheritable (PEP 446), so skipping close_fds is safe on POSIX and
+# lets subprocess use vfork/posix_spawn; on Windows, skip allocating a console.
+_FAST_SPAWN = True
+if not _FAST_SPAWN:
+    _SPAWN_KWARGS: Dict = {}
+elif os.name == 'nt':
+    _SPAWN_KWARGS = {'creationflags': subprocess.CREATE_NO_WINDOW}
+else:
+    _SPAWN_KWARGS = {'close_fds': False}
+
 
 @dataclass
 class PohTestResult:
@@ -55,12 +85,26 @@ class PohTestSuite:
 class PohTestRunner:
     """Automated test runner with watch mode and reporting"""
     
-    def __init__(self, project_root: Path, verbose: bool = False):
+    def __init__(self, project_root: Path, verbose: bool = False,
+                 parallel: int = 0, sequential: bool = False, driver: bool = False):
         self.project_root = project_root
         self.verbose = verbose
+        # 0 means "pick from cpu_count"; sequential forces one-at-a-time, reproducible runs
+        self.parallel = parallel
+        self.sequential = sequential
+        # Opt-in: only runtimes implementing `pohlang --driver` can reuse one process
+        self.driver = driver
         self.test_dir = project_root / 'tests'
         self.plhub_root = Path(__file__).parent.parent
         self.results_dir = project_root / '.plhub' / 'test-results'
+        self._project_root_parts = project_root.parts
+        self._pohlang_bin: Optional[Path] = None
+        # Persistent driver processes, one per worker thread, only during a driver run
+        self._driver_supported: Optional[bool] = None
+        self._driver_session = False
+        self._drivers = threading.local()
+        self._driver_procs: List[subprocess.Popen] = []
+        self._driver_lock = threading.Lock()
         
     def log(self, message: str):
         """Print message if verbose mode enabled"""
@@ -69,7 +113,10 @@ class PohTestRunner:
             print(f"[{timestamp}] {message}")
     
     def find_pohlang_binary(self) -> Optional[Path]:
-        """Locate the PohLang runtime binary"""
+        """Locate the PohLang runtime binary (cached after the first hit)"""
+        if self._pohlang_bin is not None:
+            return self._pohlang_bin
+        
         exe = 'pohlang.exe' if platform.system().lower().startswith('win') else 'pohlang'
         candidates = [
             self.plhub_root / 'Runtime' / 'bin' / exe,
@@ -81,32 +128,54 @@ class PohTestRunner:
         
         for candidate in candidates:
             if candidate.exists():
+                self._pohlang_bin = candidate
                 return candidate
         
         return None
     
     def discover_tests(self, filter_pattern: Optional[str] = None) -> List[Path]:
-        """Discover all test files in the tests directory"""
+        """Discover all test files in the tests directory
+        
+        filter_pattern is a case-insensitive regex matched against the file stem.
+        """
         if not self.test_dir.exists():
             return []
         
         test_files = []
+        matcher = re.compile(filter_pattern, re.IGNORECASE) if filter_pattern else None
         
-        # Look for files with 'test' in the name
-        for file_path in self.test_dir.rglob('*.poh'):
-            if 'test' in file_path.stem.lower():
-                if filter_pattern:
-                    if re.search(filter_pattern, str(file_path), re.IGNORECASE):
-                        test_files.append(file_path)
-                else:
-                    test_files.append(file_path)
+        # Look for files with 'test' in the name; only matches become Path objects
+        pending = [str(self.test_dir)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif name.endswith('.poh') and 'test' in name[:-4].lower():
+                            if matcher and not matcher.search(name[:-4]):
+                                continue
+                            if entry.is_file():
+                                test_files.append(Path(entry.path))
+            except OSError:
+                continue
         
         return sorted(test_files)
     
+    def _relative(self, path: Path) -> str:
+        """Path relative to the project root, by parts prefix (no exception on mismatch)"""
+        parts = path.parts
+        root_len = len(self._project_root_parts)
+        if parts[:root_len] == self._project_root_parts:
+            return os.sep.join(parts[root_len:])
+        return str(path)
+    
     def run_test_file(self, file_path: Path) -> PohTestResult:
         """Run a single test file and capture results"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         pohlang_bin = self.find_pohlang_binary()
+        rel = self._relative(file_path)
         
         if not pohlang_bin:
             return PohTestResult(
@@ -118,23 +187,29 @@ class PohTestRunner:
                 error='PohLang binary not found'
             )
         
+        if self._driver_session:
+            driver_result = self._run_in_driver(pohlang_bin, file_path, rel, start_time)
+            if driver_result is not None:
+                return driver_result
+        
         try:
             result = subprocess.run(
                 [str(pohlang_bin), '--run', str(file_path)],
                 capture_output=True,
                 text=True,
                 cwd=self.project_root,
-                timeout=30  # 30 second timeout
+                timeout=_TEST_TIMEOUT,
+                **_SPAWN_KWARGS
             )
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             output = result.stdout
             error = result.stderr if result.returncode != 0 else None
             passed = result.returncode == 0
             
             return PohTestResult(
                 name=file_path.stem,
-                file=str(file_path.relative_to(self.project_root)),
+                file=rel,
                 passed=passed,
                 duration=duration,
                 output=output,
@@ -142,28 +217,148 @@ class PohTestRunner:
             )
             
         except subprocess.TimeoutExpired:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             return PohTestResult(
                 name=file_path.stem,
-                file=str(file_path.relative_to(self.project_root)),
+                file=rel,
                 passed=False,
                 duration=duration,
                 output='',
                 error='Test timed out after 30 seconds'
             )
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             return PohTestResult(
                 name=file_path.stem,
-                file=str(file_path.relative_to(self.project_root)),
+                file=rel,
                 passed=False,
                 duration=duration,
                 output='',
                 error=str(e)
             )
     
-    def run_all_tests(self, filter_pattern: Optional[str] = None) -> PohTestSuite:
-        """Run all discovered tests"""
+    def _spawn_driver(self, pohlang_bin: Path) -> Optional[subprocess.Popen]:
+        """Start a persistent `pohlang --driver` process, or None if the runtime lacks one"""
+        # select() only works on pipes on POSIX
+        if self._driver_supported is False or os.name == 'nt':
+            return None
+        
+        try:
+            proc = subprocess.Popen(
+                [str(pohlang_bin), '--driver'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                cwd=self.project_root,
+                **_SPAWN_KWARGS
+            )
+        except OSError:
+            self._driver_supported = False
+            return None
+        
+        # A driver-capable runtime greets with {"ready": true}; anything else means no
+        line = self._read_driver_line(proc, _DRIVER_HANDSHAKE_TIMEOUT)
+        try:
+            ready = bool(line) and json.loads(line).get('ready') is True
+        except (ValueError, AttributeError):
+            ready = False
+        
+        if not ready:
+            self._stop_driver(proc)
+            self._driver_supported = False
+            self.log("PohLang driver mode unavailable, spawning per test file")
+            return None
+        
+        self._driver_supported = True
+        with self._driver_lock:
+            self._driver_procs.append(proc)
+        return proc
+    
+    @staticmethod
+    def _read_driver_line(proc: subprocess.Popen, timeout: float) -> Optional[str]:
+        """Read one line from the driver; None on timeout, '' on EOF"""
+        ready, _, _ = select.select([proc.stdout], [], [], timeout)
+        if not ready:
+            return None
+        return proc.stdout.readline()
+    
+    @staticmethod
+    def _stop_driver(proc: subprocess.Popen):
+        """Shut a driver process down, killing it if it does not exit promptly"""
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    
+    def _run_in_driver(self, pohlang_bin: Path, file_path: Path, rel: str,
+                       start_time: float) -> Optional[PohTestResult]:
+        """Run a test through this thread's driver; None means use a fresh process instead"""
+        driver = getattr(self._drivers, 'proc', None)
+        if driver is None or driver.poll() is not None:
+            driver = self._spawn_driver(pohlang_bin)
+            self._drivers.proc = driver
+            if driver is None:
+                return None
+        
+        try:
+            driver.stdin.write(f"{file_path}\n")
+            driver.stdin.flush()
+        except OSError:
+            self._drivers.proc = None
+            return None
+        
+        line = self._read_driver_line(driver, _TEST_TIMEOUT)
+        if line is None:
+            # Hung test: the driver is unusable, the next test gets a new one
+            self._drivers.proc = None
+            driver.kill()
+            return PohTestResult(
+                name=file_path.stem,
+                file=rel,
+                passed=False,
+                duration=time.perf_counter() - start_time,
+                output='',
+                error=f'Test timed out after {_TEST_TIMEOUT} seconds'
+            )
+        
+        try:
+            reply = json.loads(line)
+        except ValueError:
+            reply = None
+        if not isinstance(reply, dict):
+            # Driver crashed or spoke out of protocol
+            self._drivers.proc = None
+            driver.kill()
+            return None
+        
+        passed = bool(reply.get('ok'))
+        return PohTestResult(
+            name=file_path.stem,
+            file=rel,
+            passed=passed,
+            duration=float(reply.get('duration', time.perf_counter() - start_time)),
+            output=reply.get('out', ''),
+            error=None if passed else (reply.get('err') or 'Test failed')
+        )
+    
+    def _close_drivers(self):
+        """Stop every driver started during the current run"""
+        with self._driver_lock:
+            procs, self._driver_procs = self._driver_procs, []
+        for proc in procs:
+            self._stop_driver(proc)
+        self._drivers = threading.local()
+    
+    def run_all_tests(self, filter_pattern: Optional[str] = None,
+                      batch_size: int = 1) -> PohTestSuite:
+        """Run all discovered tests (batch_size > 1 shares one interpreter per batch)"""
         test_files = self.discover_tests(filter_pattern)
         
         if not test_files:
@@ -182,24 +377,39 @@ class PohTestRunner:
         
         print(f"🧪 Running {len(test_files)} test(s)...\n")
         
-        start_time = time.time()
-        results = []
+        # Probe once per run (not per test) so a freshly installed runtime is picked up
+        self._pohlang_bin = None
+        self.find_pohlang_binary()
         
-        for test_file in test_files:
-            self.log(f"Running {test_file.name}...")
-            result = self.run_test_file(test_file)
-            results.append(result)
-            
-            # Print progress
-            status = "✅" if result.passed else "❌"
-            print(f"{status} {result.name} ({result.duration:.2f}s)")
-            
-            if result.error and self.verbose:
-                print(f"   Error: {result.error}")
+        units = self._plan_units(test_files, batch_size)
+        order = {test_file: index for index, test_file in enumerate(test_files)}
+        results: List[Optional[PohTestResult]] = [None] * len(test_files)
+        
+        start_time = time.perf_counter()
+        # Batches bring their own interpreter, so drivers are only used unbatched
+        self._driver_session = self.driver and batch_size <= 1
+        try:
+            if self.sequential or len(units) == 1:
+                for unit in units:
+                    for test_file, result in zip(unit, self._run_unit(unit)):
+                        results[order[test_file]] = result
+                        self._report_progress(result)
+            else:
+                # Threads are enough here: the work happens in child processes
+                workers = self.parallel or max(1, (os.cpu_count() or 1) - 2)
+                with ThreadPoolExecutor(max_workers=min(workers, len(units))) as executor:
+                    futures = {executor.submit(self._run_unit, unit): unit for unit in units}
+                    for future in as_completed(futures):
+                        for test_file, result in zip(futures[future], future.result()):
+                            results[order[test_file]] = result
+                            self._report_progress(result)
+        finally:
+            self._driver_session = False
+            self._close_drivers()
         
-        total_duration = time.time() - start_time
-        passed = sum(1 for r in results if r.passed)
-        failed = sum(1 for r in results if not r.passed)
+        total_duration = time.perf_counter() - start_time
+        passed = sum(r.passed for r in results)
+        failed = len(results) - passed
         
         test_suite = PohTestSuite(
             total=len(results),
@@ -216,45 +426,172 @@ class PohTestRunner:
         
         return test_suite
     
+    def _plan_units(self, test_files: List[Path], batch_size: int) -> List[List[Path]]:
+        """Group test files into batches, keeping opted-out files on their own"""
+        if batch_size <= 1:
+            return [[test_file] for test_file in test_files]
+        
+        units: List[List[Path]] = []
+        batch: List[Path] = []
+        for test_file in test_files:
+            if _UNBATCHABLE_PATH.search(test_file.resolve().as_posix()):
+                # Cannot be quoted into an Import line
+                units.append([test_file])
+                continue
+            try:
+                hermetic = _NO_BATCH_MARKER not in test_file.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                hermetic = False
+            if not hermetic:
+                units.append([test_file])
+                continue
+            batch.append(test_file)
+            if len(batch) == batch_size:
+                units.append(batch)
+                batch = []
+        if batch:
+            units.append(batch)
+        return units
+    
+    def _run_unit(self, unit: List[Path]) -> List[PohTestResult]:
+        """Run one scheduling unit: a single file or a batch"""
+        for test_file in unit:
+            self.log(f"Running {test_file.name}...")
+        if len(unit) == 1:
+            return [self.run_test_file(unit[0])]
+        return self._run_batch(unit)
+    
+    def _run_batch(self, test_files: List[Path]) -> List[PohTestResult]:
+        """Run several test files in one interpreter through a generated Import script"""
+        import tempfile
+        
+        pohlang_bin = self.find_pohlang_binary()
+        if not pohlang_bin:
+            return [self.run_test_file(test_file) for test_file in test_files]
+        
+        lines = []
+        for index, test_file in enumerate(test_files):
+            lines.append(f'Write "{_BATCH_MARK}START {index}"')
+            lines.append(f'Import "{test_file.resolve().as_posix()}"')
+            lines.append(f'Write "{_BATCH_MARK}END {index}"')
+        
+        start_time = time.perf_counter()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            batch_file = Path(tmp_dir) / '_batch.poh'
+            batch_file.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+            try:
+                proc = subprocess.run(
+                    [str(pohlang_bin), '--run', str(batch_file)],
+                    capture_output=True,
+                    text=True,
+                    cwd=self.project_root,
+                    timeout=_TEST_TIMEOUT * len(test_files),
+                    **_SPAWN_KWARGS
+                )
+                stdout = proc.stdout
+            except subprocess.TimeoutExpired as e:
+                stdout = e.stdout or ''
+                if isinstance(stdout, bytes):
+                    stdout = stdout.decode('utf-8', errors='replace')
+            except OSError:
+                stdout = ''
+        
+        # Split the combined output back into per-test chunks
+        outputs: Dict[int, List[str]] = {}
+        finished = set()
+        current = None
+        for line in stdout.splitlines():
+            if line.startswith(_BATCH_MARK):
+                tag, _, index = line[len(_BATCH_MARK):].partition(' ')
+                if tag == 'START':
+                    current = int(index)
+                    outputs[current] = []
+                else:
+                    finished.add(int(index))
+                    current = None
+            elif current is not None:
+                outputs[current].append(line)
+        
+        share = (time.perf_counter() - start_time) / max(1, len(outputs))
+        results = []
+        for index, test_file in enumerate(test_files):
+            if index in finished:
+                results.append(PohTestResult(
+                    name=test_file.stem,
+                    file=self._relative(test_file),
+                    passed=True,
+                    duration=share,
+                    output='\n'.join(outputs[index]) + '\n',
+                    error=None
+                ))
+            else:
+                # Failed, timed out, or never reached: confirm with a dedicated run
+                # so the error and duration belong to this test alone
+                results.append(self.run_test_file(test_file))
+        return results
+    
+    def _report_progress(self, result: PohTestResult):
+        """Print a one-line status for a finished test"""
+        status = "✅" if result.passed else "❌"
+        print(f"{status} {result.name} ({result.duration:.2f}s)")
+        
+        if result.error and self.verbose:
+            print(f"   Error: {result.error}")
+    
     def save_results(self, suite: PohTestSuite):
         """Save test results to JSON file"""
         self.results_dir.mkdir(parents=True, exist_ok=True)
         
-        # Save latest results
-        latest_file = self.results_dir / 'latest.json'
-        with open(latest_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'suite': asdict(suite),
-                'results': [asdict(r) for r in suite.results]
-            }, f, indent=2)
+        # Convert once; the top-level 'results' shares the suite's list
+        suite_data = asdict(suite)
+        payload = {'suite': suite_data, 'results': suite_data['results']}
+        if orjson is not None:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(payload, indent=2).encode('utf-8')
         
         # Save timestamped results
         timestamp_file = self.results_dir / f"test-{suite.timestamp.replace(':', '-')}.json"
-        with open(timestamp_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'suite': asdict(suite),
-                'results': [asdict(r) for r in suite.results]
-            }, f, indent=2)
+        timestamp_file.write_bytes(data)
+        
+        # Point latest.json at it: hardlink, else symlink, else a copy. Built
+        # under a temp name and swapped in so latest.json never goes missing.
+        latest_tmp = self.results_dir / 'latest.json.tmp'
+        latest_tmp.unlink(missing_ok=True)
+        try:
+            os.link(timestamp_file, latest_tmp)
+        except OSError:
+            try:
+                latest_tmp.symlink_to(timestamp_file.name)
+            except OSError:
+                latest_tmp.write_bytes(data)
+        os.replace(latest_tmp, self.results_dir / 'latest.json')
     
     def print_summary(self, suite: PohTestSuite):
         """Print test suite summary"""
-        print("\n" + "=" * 60)
-        print("TEST SUMMARY")
-        print("=" * 60)
-        print(f"Total:    {suite.total}")
-        print(f"Passed:   {suite.passed} ✅")
-        print(f"Failed:   {suite.failed} ❌")
-        print(f"Duration: {suite.duration:.2f}s")
-        print(f"Success:  {suite.success_rate:.1f}%")
-        print("=" * 60)
+        lines = [
+            "",
+            "=" * 60,
+            "TEST SUMMARY",
+            "=" * 60,
+            f"Total:    {suite.total}",
+            f"Passed:   {suite.passed} ✅",
+            f"Failed:   {suite.failed} ❌",
+            f"Duration: {suite.duration:.2f}s",
+            f"Success:  {suite.success_rate:.1f}%",
+            "=" * 60,
+        ]
         
         if suite.failed > 0:
-            print("\nFailed tests:")
+            lines.append("\nFailed tests:")
             for result in suite.results:
                 if not result.passed:
-                    print(f"  ❌ {result.name}")
+                    lines.append(f"  ❌ {result.name}")
                     if result.error:
-                        print(f"     {result.error}")
+                        lines.append(f"     {result.error}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     def watch_mode(self, filter_pattern: Optional[str] = None):
         """Watch for changes and re-run tests automatically"""
@@ -268,13 +605,16 @@ class PohTestRunner:
         try:
             from watchdog.observers import Observer
             from watchdog.events import FileSystemEventHandler
-            import threading
             
             class TestFileHandler(FileSystemEventHandler):
                 def __init__(self, runner, filter_pattern):
                     self.runner = runner
                     self.filter_pattern = filter_pattern
-                    self.debounce_timer = None
+                    # One long-lived worker; bursts of events within the
+                    # debounce window collapse into a single rerun
+                    self._pending = threading.Event()
+                    self._stopped = threading.Event()
+                    threading.Thread(target=self._runner_loop, daemon=True).start()
                 
                 def on_modified(self, event):
                     if event.is_directory or not event.src_path.endswith('.poh'):
@@ -287,17 +627,26 @@ class PohTestRunner:
                     self.trigger_rerun()
                 
                 def trigger_rerun(self):
-                    if self.debounce_timer:
-                        self.debounce_timer.cancel()
-                    
-                    def do_rerun():
+                    self._pending.set()
+                
+                def stop(self):
+                    self._stopped.set()
+                    self._pending.set()
+                
+                def _runner_loop(self):
+                    while True:
+                        self._pending.wait()
+                        if self._stopped.is_set():
+                            return
+                        time.sleep(0.5)
+                        self._pending.clear()
+                        if self._stopped.is_set():
+                            return
+                        
                         print("\n📝 Changes detected, re-running tests...\n")
                         suite = self.runner.run_all_tests(self.filter_pattern)
                         self.runner.print_summary(suite)
                         print("\n👀 Watching for changes...")
-                    
-                    self.debounce_timer = threading.Timer(0.5, do_rerun)
-                    self.debounce_timer.start()
             
             event_handler = TestFileHandler(self, filter_pattern)
             observer = Observer()
@@ -313,6 +662,7 @@ class PohTestRunner:
                 while True:
                     time.sleep(1)
             except KeyboardInterrupt:
+                event_handler.stop()
                 observer.stop()
                 print("\n⏹️  Watch mode stopped")
             observer.join()
@@ -324,43 +674,49 @@ class PohTestRunner:
     def generate_ci_report(self, suite: PohTestSuite, format: str = 'github') -> str:
         """Generate CI-friendly test report"""
         if format == 'github':
-            report = "## Test Results\n\n"
-            report += f"- **Total Tests:** {suite.total}\n"
-            report += f"- **Passed:** {suite.passed} ✅\n"
-            report += f"- **Failed:** {suite.failed} ❌\n"
-            report += f"- **Duration:** {suite.duration:.2f}s\n"
-            report += f"- **Success Rate:** {suite.success_rate:.1f}%\n\n"
+            parts = [
+                "## Test Results\n\n",
+                f"- **Total Tests:** {suite.total}\n",
+                f"- **Passed:** {suite.passed} ✅\n",
+                f"- **Failed:** {suite.failed} ❌\n",
+                f"- **Duration:** {suite.duration:.2f}s\n",
+                f"- **Success Rate:** {suite.success_rate:.1f}%\n\n",
+            ]
             
             if suite.failed > 0:
-                report += "### Failed Tests\n\n"
+                parts.append("### Failed Tests\n\n")
                 for result in suite.results:
                     if not result.passed:
-                        report += f"- ❌ **{result.name}**\n"
+                        parts.append(f"- ❌ **{result.name}**\n")
                         if result.error:
-                            report += f"  ```\n  {result.error}\n  ```\n"
+                            parts.append(f"  ```\n  {result.error}\n  ```\n")
             
-            return report
+            return ''.join(parts)
         
         elif format == 'junit':
-            # JUnit XML format for CI/CD systems
-            xml = '<?xml version="1.0" encoding="UTF-8"?>\n'
-            xml += f'<PohTestSuite name="PohLang Tests" tests="{suite.total}" '
-            xml += f'failures="{suite.failed}" time="{suite.duration:.2f}">\n'
+            # JUnit XML format for CI/CD systems; names and errors are escaped
+            from xml.sax.saxutils import escape, quoteattr
+            
+            parts = [
+                '<?xml version="1.0" encoding="UTF-8"?>\n',
+                f'<PohTestSuite name="PohLang Tests" tests="{suite.total}" ',
+                f'failures="{suite.failed}" time="{suite.duration:.2f}">\n',
+            ]
             
             for result in suite.results:
-                xml += f'  <testcase name="{result.name}" '
-                xml += f'classname="{result.file}" time="{result.duration:.2f}"'
+                parts.append(f'  <testcase name={quoteattr(result.name)} '
+                             f'classname={quoteattr(result.file)} time="{result.duration:.2f}"')
                 if result.passed:
-                    xml += ' />\n'
+                    parts.append(' />\n')
                 else:
-                    xml += '>\n'
-                    xml += f'    <failure message="{result.error or "Test failed"}">\n'
-                    xml += f'      {result.error or ""}\n'
-                    xml += '    </failure>\n'
-                    xml += '  </testcase>\n'
+                    parts.append('>\n')
+                    parts.append(f'    <failure message={quoteattr(result.error or "Test failed")}>\n')
+                    parts.append(f'      {escape(result.error or "")}\n')
+                    parts.append('    </failure>\n')
+                    parts.append('  </testcase>\n')
             
-            xml += '</PohTestSuite>\n'
-            return xml
+            parts.append('</PohTestSuite>\n')
+            return ''.join(parts)
         
         return ''
 
@@ -6,12 +6,68 @@ Provides beautiful, intuitive command-line interface utilities for all PLHub com
 import sys
 import os
 import time
+import difflib
 import shutil
-from typing import Optional, List, Callable, Any
+import threading
+import weakref
+from collections import deque
+from itertools import zip_longest
+from typing import Optional, List, Callable, Any, Union
 from pathlib import Path
 from enum import Enum
 
 
+# Minimum gap between progress redraws (~24 FPS)
+_RENDER_INTERVAL_NS = 40_000_000
+# ETA uses the rate over the last N renders and is redrawn at most twice a second
+_RATE_WINDOW = 30
+_ETA_REFRESH = 0.5
+# DownloadProgress folds updates smaller than this into the next one
+_COALESCE_BYTES = 16 * 1024
+# Terminal width is re-queried at most every 500 ms, so resizes show up within that
+_TERM_WIDTH_TTL = 0.5
+_TERM_W = [0, float('-inf')]  # [columns, monotonic time of last query]
+
+
+def _rolling_rate(samples: deque) -> float:
+    """Units per second across a window of (monotonic time, value) samples"""
+    (t_first, v_first), (t_last, v_last) = samples[0], samples[-1]
+    return (v_last - v_first) / max(1e-9, t_last - t_first)
+
+
+# Redraws go straight to fd 1 when it is a terminal, skipping the text layer.
+# Windows consoles are left to print(), which handles their code page.
+_STDOUT = sys.stdout
+try:
+    _STDOUT_FD = _STDOUT.fileno()
+    _STDOUT_RAW = sys.platform != 'win32' and os.isatty(_STDOUT_FD)
+except (AttributeError, OSError, ValueError):  # pragma: no cover - detached/replaced stdout
+    _STDOUT_FD, _STDOUT_RAW = 1, False
+_STDOUT_ENCODING = getattr(_STDOUT, 'encoding', None) or 'utf-8'
+
+
+def _write_status(text: Union[str, bytes]):
+    """Write an in-place status redraw (no newline) to stdout"""
+    if _STDOUT_RAW and sys.stdout is _STDOUT:
+        _STDOUT.flush()  # keep ordering with anything print() buffered
+        if isinstance(text, str):
+            text = text.encode(_STDOUT_ENCODING, 'replace')
+        os.write(_STDOUT_FD, text)
+    else:
+        if isinstance(text, bytes):
+            text = text.decode(_STDOUT_ENCODING, 'replace')
+        print(text, end="", flush=True)
+
+
+def _term_width() -> int:
+    """Terminal width in columns, cached briefly to avoid a syscall per call"""
+    now = time.monotonic()
+    if now - _TERM_W[1] >= _TERM_WIDTH_TTL:
+        _TERM_W[0] = shutil.get_terminal_size((80, 20)).columns
+        _TERM_W[1] = now
+    return _TERM_W[0]
+
+
 class Color:
     """ANSI color codes for terminal output"""
     # Basic colors
@@ -61,15 +117,8 @@ class Color:
         for attr in dir(Color):
             if not attr.startswith('_') and attr.isupper():
                 setattr(Color, attr, '')
-
-
-# Disable colors if not supported
-if not Color.enabled() and os.getenv('PLHUB_NO_COLOR') != '1':
-    try:
-        import colorama
-        colorama.init()
-    except:
-        Color.disable()
+        _PFX.update(_build_prefixes())
+        _use_plain_messages()
 
 
 class Icon:
@@ -103,50 +152,75 @@ class Icon:
     PHONE = "📱"
 
 
+def _build_prefixes() -> dict:
+    """ANSI-wrapped prefixes for the UI message helpers"""
+    return {
+        'success': f"{Color.GREEN}{Icon.SUCCESS} ",
+        'error': f"{Color.RED}{Icon.ERROR} ",
+        'warning': f"{Color.YELLOW}{Icon.WARNING} ",
+        'info': f"{Color.CYAN}{Icon.INFO} ",
+        'step': f"{Color.BOLD}{Color.BLUE}{Icon.ARROW}{Color.RESET} ",
+        'tip': f"{Color.YELLOW}{Icon.LIGHT} Tip:{Color.RESET} ",
+        'command': f"{Color.DIM}$ {Color.RESET}{Color.BRIGHT_WHITE}",
+        'reset_nl': f"{Color.RESET}\n",
+    }
+
+
+# Built once at import (and again by Color.disable) instead of on every message
+_PFX = _build_prefixes()
+
+
 class UI:
     """User-friendly UI helper methods"""
     
     @staticmethod
     def success(message: str, prefix: str = ""):
         """Print success message with green color"""
-        prefix_str = f"{prefix} " if prefix else f"{Icon.SUCCESS} "
-        print(f"{Color.GREEN}{prefix_str}{message}{Color.RESET}")
+        _ensure_colors()
+        head = f"{Color.GREEN}{prefix} " if prefix else _PFX['success']
+        sys.stdout.write(f"{head}{message}{_PFX['reset_nl']}")
     
     @staticmethod
     def error(message: str, prefix: str = ""):
         """Print error message with red color"""
-        prefix_str = f"{prefix} " if prefix else f"{Icon.ERROR} "
-        print(f"{Color.RED}{prefix_str}{message}{Color.RESET}", file=sys.stderr)
+        _ensure_colors()
+        head = f"{Color.RED}{prefix} " if prefix else _PFX['error']
+        sys.stderr.write(f"{head}{message}{_PFX['reset_nl']}")
     
     @staticmethod
     def warning(message: str, prefix: str = ""):
         """Print warning message with yellow color"""
-        prefix_str = f"{prefix} " if prefix else f"{Icon.WARNING} "
-        print(f"{Color.YELLOW}{prefix_str}{message}{Color.RESET}")
+        _ensure_colors()
+        head = f"{Color.YELLOW}{prefix} " if prefix else _PFX['warning']
+        sys.stdout.write(f"{head}{message}{_PFX['reset_nl']}")
     
     @staticmethod
     def info(message: str, prefix: str = ""):
         """Print info message with blue color"""
-        prefix_str = f"{prefix} " if prefix else f"{Icon.INFO} "
-        print(f"{Color.CYAN}{prefix_str}{message}{Color.RESET}")
+        _ensure_colors()
+        head = f"{Color.CYAN}{prefix} " if prefix else _PFX['info']
+        sys.stdout.write(f"{head}{message}{_PFX['reset_nl']}")
     
     @staticmethod
     def step(message: str, number: Optional[int] = None):
         """Print step message"""
+        _ensure_colors()
         if number:
             print(f"{Color.BOLD}{Color.BLUE}[{number}]{Color.RESET} {message}")
         else:
-            print(f"{Color.BOLD}{Color.BLUE}{Icon.ARROW}{Color.RESET} {message}")
+            sys.stdout.write(f"{_PFX['step']}{message}\n")
     
     @staticmethod
     def header(message: str):
         """Print header message"""
+        _ensure_colors()
         print(f"\n{Color.BOLD}{Color.CYAN}{message}{Color.RESET}")
         print(f"{Color.DIM}{'=' * min(len(message), 60)}{Color.RESET}")
     
     @staticmethod
     def section(message: str):
         """Print section message"""
+        _ensure_colors()
         print(f"\n{Color.BOLD}{message}{Color.RESET}")
     
     @staticmethod
@@ -157,23 +231,27 @@ class UI:
     @staticmethod
     def detail(key: str, value: str, indent: int = 0):
         """Print key-value detail"""
+        _ensure_colors()
         print(f"{'  ' * indent}{Color.DIM}{key}:{Color.RESET} {Color.BOLD}{value}{Color.RESET}")
     
     @staticmethod
     def command(cmd: str):
         """Print command to run"""
-        print(f"{Color.DIM}$ {Color.RESET}{Color.BRIGHT_WHITE}{cmd}{Color.RESET}")
+        _ensure_colors()
+        sys.stdout.write(f"{_PFX['command']}{cmd}{_PFX['reset_nl']}")
     
     @staticmethod
     def tip(message: str):
         """Print helpful tip"""
-        print(f"{Color.YELLOW}{Icon.LIGHT} Tip:{Color.RESET} {message}")
+        _ensure_colors()
+        sys.stdout.write(f"{_PFX['tip']}{message}\n")
     
     @staticmethod
     def divider(char: str = "-", width: Optional[int] = None):
         """Print divider line"""
+        _ensure_colors()
         if width is None:
-            width = shutil.get_terminal_size((80, 20)).columns
+            width = _term_width()
         print(f"{Color.DIM}{char * width}{Color.RESET}")
 
 
@@ -181,48 +259,72 @@ class ProgressBar:
     """Progress bar for long-running operations"""
     
     def __init__(self, total: int, description: str = "", width: int = 40):
+        _ensure_colors()
         self.total = total
         self.current = 0
         self.description = description
         self.width = width
+        self._full = "█" * width
+        self._empty = "░" * width
         self.start_time = time.time()
-        self._last_update = 0
+        self._last_update_ns = 0
+        self._dirty = True
+        self._samples = deque([(time.monotonic(), 0)], maxlen=_RATE_WINDOW)
+        self._eta = 0.0
+        self._eta_at = float('-inf')
     
     def update(self, amount: int = 1, description: Optional[str] = None):
         """Update progress bar"""
-        self.current = min(self.current + amount, self.total)
-        if description:
+        current = min(self.current + amount, self.total)
+        if current != self.current:
+            self.current = current
+            self._dirty = True
+        if description and description != self.description:
             self.description = description
+            self._dirty = True
         
-        # Throttle updates to avoid flickering
-        now = time.time()
-        if now - self._last_update < 0.1 and self.current < self.total:
+        # Nothing new to show
+        if not self._dirty:
             return
-        self._last_update = now
+        
+        # Throttle updates to avoid flickering; the final state always renders
+        now_ns = time.monotonic_ns()
+        if now_ns - self._last_update_ns < _RENDER_INTERVAL_NS and self.current < self.total:
+            return
+        self._last_update_ns = now_ns
         
         self._render()
     
     def _render(self):
         """Render progress bar"""
+        self._dirty = False
         percent = (self.current / self.total) * 100 if self.total > 0 else 0
         filled = int(self.width * self.current / self.total) if self.total > 0 else 0
-        bar = "█" * filled + "░" * (self.width - filled)
+        bar = self._full[:filled] + self._empty[filled:]
         
-        elapsed = time.time() - self.start_time
-        rate = self.current / elapsed if elapsed > 0 else 0
-        eta = (self.total - self.current) / rate if rate > 0 else 0
+        now = time.monotonic()
+        self._samples.append((now, self.current))
+        if now - self._eta_at >= _ETA_REFRESH:
+            rate = _rolling_rate(self._samples)
+            self._eta = (self.total - self.current) / rate if rate > 0 else 0
+            self._eta_at = now
+        eta = self._eta
         
         eta_str = self._format_time(eta)
         
         # Build status line
-        status = f"{self.description} {Color.BRIGHT_CYAN}{bar}{Color.RESET} "
-        status += f"{Color.BOLD}{percent:.1f}%{Color.RESET} "
-        status += f"({self.current}/{self.total}) "
-        if eta > 0 and self.current < self.total:
-            status += f"{Color.DIM}ETA: {eta_str}{Color.RESET}"
+        eta_part = (
+            f"{Color.DIM}ETA: {eta_str}{Color.RESET}"
+            if eta > 0 and self.current < self.total else ""
+        )
+        status = (
+            f"{self.description} {Color.BRIGHT_CYAN}{bar}{Color.RESET} "
+            f"{Color.BOLD}{percent:.1f}%{Color.RESET} "
+            f"({self.current}/{self.total}) {eta_part}"
+        )
         
         # Clear line and print
-        print(f"\r{status}", end="", flush=True)
+        _write_status(f"\r{status}")
         
         if self.current >= self.total:
             print()  # New line when complete
@@ -246,6 +348,54 @@ class ProgressBar:
             UI.success(message)
 
 
+class _SpinnerService:
+    """One shared daemon thread that animates every active Spinner"""
+    
+    INTERVAL = 0.1
+    FAST_INTERVAL = 0.016
+    FAST_WINDOW = 0.1
+    
+    def __init__(self):
+        self._spinners = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._started = 0.0
+    
+    def register(self, spinner: "Spinner"):
+        """Start animating a spinner, booting the thread on first use"""
+        with self._lock:
+            self._spinners.add(spinner)
+            self._started = time.monotonic()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="plhub-spinner", daemon=True)
+                self._thread.start()
+        self._wake.set()
+    
+    def unregister(self, spinner: "Spinner"):
+        """Stop animating a spinner; no frame of it is drawn after this returns"""
+        with self._lock:
+            self._spinners.discard(spinner)
+    
+    def _run(self):
+        """Tick loop; parks on the wake event while no spinner is active"""
+        while True:
+            self._wake.wait()
+            with self._lock:
+                spinners = list(self._spinners)
+                if not spinners:
+                    self._wake.clear()
+                    continue
+                for spinner in spinners:
+                    spinner._draw()
+                fast = time.monotonic() - self._started < self.FAST_WINDOW
+            # Tick quickly right after a start so short-lived spinners settle fast
+            time.sleep(self.FAST_INTERVAL if fast else self.INTERVAL)
+
+
+_spinner_service = _SpinnerService()
+
+
 class Spinner:
     """Animated spinner for indeterminate operations"""
     
@@ -253,9 +403,9 @@ class Spinner:
     
     def __init__(self, description: str = "Working..."):
         self.description = description
-        self.frame = 0
         self.running = False
-        self._thread = None
+        self._frames_for = None
+        self._frames: List[bytes] = []
     
     def __enter__(self):
         """Start spinner"""
@@ -268,28 +418,29 @@ class Spinner:
     
     def start(self):
         """Start spinner animation"""
-        import threading
+        _ensure_colors()
         self.running = True
-        self._thread = threading.Thread(target=self._spin)
-        self._thread.daemon = True
-        self._thread.start()
+        _spinner_service.register(self)
     
     def stop(self, final_message: Optional[str] = None):
         """Stop spinner animation"""
         self.running = False
-        if self._thread:
-            self._thread.join()
-        print(f"\r{' ' * (len(self.description) + 10)}\r", end="", flush=True)
+        _spinner_service.unregister(self)
+        _write_status(f"\r{' ' * (len(self.description) + 10)}\r")
         if final_message:
             print(final_message)
     
-    def _spin(self):
-        """Spinner animation loop"""
-        while self.running:
-            frame = self.FRAMES[self.frame % len(self.FRAMES)]
-            print(f"\r{Color.CYAN}{frame}{Color.RESET} {self.description}", end="", flush=True)
-            self.frame += 1
-            time.sleep(0.1)
+    def _draw(self):
+        """Draw the next animation frame (called from the spinner service)"""
+        if self._frames_for != self.description:
+            # Encode every frame's line once per description, not once per tick
+            self._frames_for = self.description
+            self._frames = [
+                f"\r{Color.CYAN}{frame}{Color.RESET} {self.description}".encode(_STDOUT_ENCODING, 'replace')
+                for frame in self.FRAMES
+            ]
+        # Phase comes from the shared clock so concurrent spinners stay in step
+        _write_status(self._frames[int(time.monotonic() * 10) % len(self._frames)])
 
 
 class Table:
@@ -307,37 +458,43 @@ class Table:
         """Render the table"""
         if not self.rows:
             return
+        _ensure_colors()
         
-        # Calculate column widths
-        widths = [len(h) for h in self.headers]
-        for row in self.rows:
-            for i, cell in enumerate(row):
-                widths[i] = max(widths[i], len(str(cell)))
+        cells = [[str(cell) for cell in row] for row in self.rows]
         
-        # Render header
-        header_line = " │ ".join(
-            f"{Color.BOLD}{h:<{widths[i]}}{Color.RESET}"
-            for i, h in enumerate(self.headers)
-        )
-        print(f"│ {header_line} │")
+        # Calculate column widths (short rows simply contribute nothing)
+        widths = [
+            max(map(len, col))
+            for col in zip_longest(self.headers, *cells, fillvalue="")
+        ]
         
-        # Render separator
+        # Header, separator, then rows, written in one go
+        bold, reset = Color.BOLD, Color.RESET
+        header_line = " │ ".join(f"{bold}{h.ljust(w)}{reset}" for h, w in zip(self.headers, widths))
         sep = "─┼─".join("─" * w for w in widths)
-        print(f"├─{sep}─┤")
-        
-        # Render rows
-        for row in self.rows:
-            row_line = " │ ".join(
-                f"{str(cell):<{widths[i]}}"
-                for i, cell in enumerate(row)
-            )
-            print(f"│ {row_line} │")
+        lines = [f"│ {header_line} │", f"├─{sep}─┤"]
+        lines.extend(
+            f"│ {' │ '.join(c.ljust(w) for c, w in zip(row, widths))} │"
+            for row in cells
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _prompt(text: str) -> str:
+    """Show a prompt and read one stripped line from stdin"""
+    _ensure_colors()
+    sys.stdout.write(text)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError  # same as input() at end of input
+    return line.strip()
 
 
 def confirm(message: str, default: bool = False) -> bool:
     """Ask for user confirmation"""
     suffix = " [Y/n]" if default else " [y/N]"
-    response = input(f"{Icon.INFO} {message}{suffix}: ").strip().lower()
+    response = _prompt(f"{Icon.INFO} {message}{suffix}: ").lower()
     
     if not response:
         return default
@@ -346,6 +503,7 @@ def confirm(message: str, default: bool = False) -> bool:
 
 def select(prompt: str, options: List[str], default: Optional[int] = None) -> str:
     """Let user select from options"""
+    _ensure_colors()
     print(f"\n{Icon.INFO} {prompt}")
     for i, option in enumerate(options, 1):
         default_marker = " (default)" if default == i - 1 else ""
@@ -353,7 +511,7 @@ def select(prompt: str, options: List[str], default: Optional[int] = None) -> st
     
     while True:
         try:
-            response = input(f"\nSelect [1-{len(options)}]: ").strip()
+            response = _prompt(f"\nSelect [1-{len(options)}]: ")
             if not response and default is not None:
                 return options[default]
             
@@ -376,7 +534,7 @@ def input_text(prompt: str, default: Optional[str] = None, required: bool = True
     
     while True:
         try:
-            response = input(f"{Icon.INFO} {prompt}{default_text}{required_text}: ").strip()
+            response = _prompt(f"{Icon.INFO} {prompt}{default_text}{required_text}: ")
             
             if not response and default:
                 return default
@@ -449,51 +607,76 @@ class ErrorHelper:
 
 
 class DownloadProgress:
-    """Progress tracker for downloads"""
+    """Progress tracker for downloads
+    
+    Feed it reasonably large chunks (e.g. ``iter_content(chunk_size=65536)``);
+    updates below 16 KiB are accumulated and applied together.
+    """
     
     def __init__(self, description: str, total_size: Optional[int] = None):
+        _ensure_colors()
         self.description = description
         self.total_size = total_size
         self.downloaded = 0
         self.start_time = time.time()
-        self._last_update = 0
+        self._pending = 0
+        self._last_update_ns = 0
+        self._last_rendered = -1
+        self._samples = deque([(time.monotonic(), 0)], maxlen=_RATE_WINDOW)
+        self._eta = 0.0
+        self._eta_at = float('-inf')
     
     def update(self, chunk_size: int):
         """Update download progress"""
-        self.downloaded += chunk_size
+        self._pending += chunk_size
+        complete = bool(self.total_size) and self.downloaded + self._pending >= self.total_size
+        if self._pending < _COALESCE_BYTES and not complete:
+            return
+        self.downloaded += self._pending
+        self._pending = 0
+        if self.downloaded == self._last_rendered:
+            return
         
-        # Throttle updates
-        now = time.time()
-        if now - self._last_update < 0.1 and self.total_size and self.downloaded < self.total_size:
+        # Throttle updates; completion always renders
+        now_ns = time.monotonic_ns()
+        if now_ns - self._last_update_ns < _RENDER_INTERVAL_NS and not complete:
             return
-        self._last_update = now
+        self._last_update_ns = now_ns
         
         self._render()
     
     def _render(self):
         """Render download progress"""
+        self._last_rendered = self.downloaded
         downloaded_mb = self.downloaded / 1024 / 1024
-        elapsed = time.time() - self.start_time
-        speed = self.downloaded / elapsed if elapsed > 0 else 0
+        now = time.monotonic()
+        self._samples.append((now, self.downloaded))
+        speed = _rolling_rate(self._samples)
         speed_mb = speed / 1024 / 1024
         
         if self.total_size:
             total_mb = self.total_size / 1024 / 1024
             percent = (self.downloaded / self.total_size) * 100
-            eta = (self.total_size - self.downloaded) / speed if speed > 0 else 0
+            if now - self._eta_at >= _ETA_REFRESH:
+                self._eta = (self.total_size - self.downloaded) / speed if speed > 0 else 0
+                self._eta_at = now
+            eta = self._eta if self.downloaded < self.total_size else 0
             eta_str = self._format_time(eta)
             
-            status = f"\r{Icon.DOWNLOAD} {self.description}: "
-            status += f"{Color.BOLD}{percent:.1f}%{Color.RESET} "
-            status += f"({downloaded_mb:.1f}/{total_mb:.1f} MB) "
-            status += f"at {speed_mb:.1f} MB/s "
-            if eta > 0:
-                status += f"{Color.DIM}ETA: {eta_str}{Color.RESET}"
+            eta_part = f"{Color.DIM}ETA: {eta_str}{Color.RESET}" if eta > 0 else ""
+            status = (
+                f"\r{Icon.DOWNLOAD} {self.description}: "
+                f"{Color.BOLD}{percent:.1f}%{Color.RESET} "
+                f"({downloaded_mb:.1f}/{total_mb:.1f} MB) "
+                f"at {speed_mb:.1f} MB/s {eta_part}"
+            )
         else:
-            status = f"\r{Icon.DOWNLOAD} {self.description}: "
-            status += f"{downloaded_mb:.1f} MB at {speed_mb:.1f} MB/s"
+            status = (
+                f"\r{Icon.DOWNLOAD} {self.description}: "
+                f"{downloaded_mb:.1f} MB at {speed_mb:.1f} MB/s"
+            )
         
-        print(status, end="", flush=True)
+        _write_status(status)
     
     def _format_time(self, seconds: float) -> str:
         """Format seconds to human-readable time"""
@@ -506,20 +689,35 @@ class DownloadProgress:
     
     def finish(self):
         """Complete the download"""
+        self.downloaded += self._pending
+        self._pending = 0
         self._render()
         print()  # New line
 
 
 def fuzzy_match(needle: str, haystack: List[str], threshold: float = 0.6) -> List[str]:
     """Find similar strings using fuzzy matching"""
-    import difflib
-    matches = []
-    
-    for item in haystack:
-        ratio = difflib.SequenceMatcher(None, needle.lower(), item.lower()).ratio()
+    lowered = [item.lower() for item in haystack]
+    needle = needle.lower()
+    # Needle as seq2 so its counts are built once, as difflib.get_close_matches
+    # does; the bounds are symmetric but ratio() is not, so the score itself
+    # keeps the needle first
+    bounds = difflib.SequenceMatcher(None, b=needle)
+    scorer = difflib.SequenceMatcher(None, needle)
+    
+    # Score each distinct candidate once; the cheap upper bounds rule most out
+    ratios = {}
+    for candidate in dict.fromkeys(lowered):
+        bounds.set_seq1(candidate)
+        if bounds.real_quick_ratio() < threshold or bounds.quick_ratio() < threshold:
+            continue
+        scorer.set_seq2(candidate)
+        ratio = scorer.ratio()
         if ratio >= threshold:
-            matches.append((ratio, item))
+            ratios[candidate] = ratio
     
+    # Stable sort: equal scores keep their haystack order
+    matches = [(ratios[low], item) for low, item in zip(lowered, haystack) if low in ratios]
     matches.sort(reverse=True, key=lambda x: x[0])
     return [item for _, item in matches]
 
@@ -547,3 +745,46 @@ def format_duration(seconds: float) -> str:
         hours = int(seconds / 3600)
         minutes = int((seconds % 3600) / 60)
         return f"{hours}h {minutes}m"
+
+
+def _plain_message(icon: str, stream: str, colored: Callable) -> staticmethod:
+    """Colourless stand-in for one of UI's success/error/warning/info helpers"""
+    def emit(message: str, prefix: str = ""):
+        getattr(sys, stream).write(f"{prefix or icon} {message}\n")
+    emit.__name__ = colored.__name__
+    emit.__doc__ = colored.__doc__
+    return staticmethod(emit)
+
+
+def _use_plain_messages():
+    """Rebind the hot UI message helpers so they skip colour codes entirely"""
+    UI.success = _plain_message(Icon.SUCCESS, 'stdout', UI.success)
+    UI.error = _plain_message(Icon.ERROR, 'stderr', UI.error)
+    UI.warning = _plain_message(Icon.WARNING, 'stdout', UI.warning)
+    UI.info = _plain_message(Icon.INFO, 'stdout', UI.info)
+
+
+_colors_resolved = False
+
+
+# Callers that read Color codes directly must call this first; the helpers
+# in this module already do
+def _ensure_colors():
+    """Resolve terminal colour support once, before the first coloured output"""
+    global _colors_resolved
+    if _colors_resolved:
+        return
+    _colors_resolved = True
+    
+    # Disable colors if not supported
+    if not Color.enabled() and os.getenv('PLHUB_NO_COLOR') != '1':
+        try:
+            import colorama
+            colorama.init()
+        except:
+            Color.disable()
+
+
+# Console setup (ctypes, colorama) on Windows waits until something is printed
+if sys.platform != 'win32':
+    _ensure_colors()
@@ -11,15 +11,177 @@ Usage:
 """
 
 import argparse
+import os
 import shutil
 import hashlib
+import mmap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+
+# Hashing is I/O bound and hashlib drops the GIL, so oversubscribe the cores
+_HASH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+_MMAP_THRESHOLD = 1024 * 1024
+_READ_CHUNK = 1024 * 1024
+
+# sync_all runs file and directory syncs side by side so hashing overlaps copying
+_SYNC_WORKERS = 8
+_output = threading.local()
+
+
+def _say(message: str):
+    """print(), unless the current thread is buffering output for a sync task"""
+    lines = getattr(_output, "lines", None)
+    if lines is None:
+        print(message)
+    else:
+        lines.append(message)
+
+
+def _captured(func: Callable, *args) -> Tuple[Any, List[str]]:
+    """Run func, returning its result and the lines it would have printed"""
+    _output.lines = []
+    try:
+        result = func(*args)
+    finally:
+        lines, _output.lines = _output.lines, None
+    return result, lines
+
+
+@lru_cache(maxsize=4096)
+def _sha256_of(path_str: str, mtime_ns: int, size: int) -> str:
+    """SHA256 of a file; mtime/size are part of the cache key so edits miss"""
+    with open(path_str, "rb") as f:
+        # Python 3.11+: the whole file is fed to OpenSSL without Python-level loops
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        
+        if size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
+        
+        sha256_hash = hashlib.sha256()
+        buffer = bytearray(_READ_CHUNK)
+        view = memoryview(buffer)
+        for chunk_size in iter(lambda: f.readinto(buffer), 0):
+            sha256_hash.update(view[:chunk_size])
+        return sha256_hash.hexdigest()
+
+
+def _file_hash(file_path: Path) -> str:
+    """Calculate SHA256 hash of a file ("" if it does not exist)"""
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return ""
+    return _sha256_of(str(file_path), st.st_mtime_ns, st.st_size)
+
+
+def _quick_equal(main_file: Path, sdk_file: Path) -> Optional[bool]:
+    """Decide equality from stat alone; None when only hashing can tell"""
+    try:
+        main_stat = os.stat(main_file)
+        sdk_stat = os.stat(sdk_file)
+    except OSError:
+        return None
+    
+    if main_stat.st_size != sdk_stat.st_size:
+        return False
+    # copy2 preserves mtime exactly; anything coarser (e.g. a fresh checkout
+    # giving both trees same-second mtimes) must be settled by hashing
+    if main_stat.st_mtime_ns == sdk_stat.st_mtime_ns:
+        return True
+    return None
+
+
+def _files_match(pair: Tuple[Path, Path], deep: bool = False) -> bool:
+    """Compare a (main, sdk) file pair, hashing only when stat is inconclusive"""
+    main_file, sdk_file = pair
+    if not deep:
+        quick = _quick_equal(main_file, sdk_file)
+        if quick is not None:
+            return quick
+    return _file_hash(main_file) == _file_hash(sdk_file)
+
+
+def _copy_tree_parallel(src: Path, dst: Path, workers: int = 8):
+    """Copy src into dst, creating directories first and copying files concurrently"""
+    files = []
+    for dirpath, _, filenames in os.walk(src, followlinks=True):
+        target_dir = os.path.join(dst, os.path.relpath(dirpath, src))
+        os.makedirs(target_dir, exist_ok=True)
+        files.extend(
+            (os.path.join(dirpath, name), os.path.join(target_dir, name))
+            for name in filenames
+        )
+    
+    _copy_files(files, workers)
+
+
+def _copy_files(pairs: List[Tuple[str, str]], workers: int = 8):
+    """Copy (source, target) pairs concurrently"""
+    # copy2 rides copyfile's sendfile/CopyFileEx fast path and keeps mtimes
+    # exactly, which the size+mtime comparison relies on
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(lambda pair: shutil.copy2(*pair), pairs))
+
+
+def _list_tree(root: Path, followlinks: bool = False) -> Tuple[Set[str], List[str]]:
+    """Relative file paths under root, plus its subdirectories deepest first"""
+    files = set()
+    dirs = []
+    for dirpath, _, filenames in os.walk(root, followlinks=followlinks):
+        rel_dir = os.path.relpath(dirpath, root)
+        if rel_dir != os.curdir:
+            dirs.append(rel_dir)
+        else:
+            rel_dir = ""
+        files.update(os.path.join(rel_dir, name) for name in filenames)
+    dirs.sort(key=lambda d: d.count(os.sep), reverse=True)
+    return files, dirs
+
+
+def _diff_trees(src: Path, dst: Path,
+                deep: bool = False) -> Tuple[List[str], List[str], List[str]]:
+    """Relative paths to copy (new or changed), to delete (gone from src), and
+    to clear first (a file on one side, a directory on the other)"""
+    src_files, src_dirs = _list_tree(src, followlinks=True)
+    dst_files, dst_dirs = _list_tree(dst)
+    
+    # Type changes are removed wholesale before copying, so a file never lands
+    # inside a stale directory and a new directory never collides with a file
+    kept_dirs = set(src_dirs)
+    to_clear = sorted((src_files & set(dst_dirs)) | (dst_files & kept_dirs))
+    
+    def cleared(rel: str) -> bool:
+        return any(rel == top or rel.startswith(top + os.sep) for top in to_clear)
+    
+    shared = sorted(src_files & dst_files)
+    pairs = [(src / rel, dst / rel) for rel in shared]
+    with ThreadPoolExecutor(max_workers=_HASH_WORKERS) as executor:
+        matches = list(executor.map(_files_match, pairs, [deep] * len(pairs)))
+    
+    to_copy = sorted(src_files - dst_files)
+    to_copy.extend(rel for rel, same in zip(shared, matches) if not same)
+    
+    # Files first, then emptied directories deepest first
+    to_delete = sorted(dst_files - src_files)
+    to_delete.extend(d for d in dst_dirs if d not in kept_dirs)
+    if to_clear:
+        to_delete = [rel for rel in to_delete if not cleared(rel)]
+    return to_copy, to_delete, to_clear
 
 
 class SDKUpdater:
-    def __init__(self, plhub_root: Path):
+    def __init__(self, plhub_root: Path, deep: bool = False):
         self.root = plhub_root
+        # deep=True always compares content hashes, never trusting size+mtime
+        self.deep = deep
         self.sdk_dir = self.root / "plhub-sdk"
         
         # Files to sync from main to SDK
@@ -43,14 +205,14 @@ class SDKUpdater:
     
     def _get_file_hash(self, file_path: Path) -> str:
         """Calculate SHA256 hash of a file"""
-        if not file_path.exists():
-            return ""
-        
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        return _file_hash(file_path)
+    
+    def _compare_files(self, file_names: List[str]) -> Dict[str, bool]:
+        """Compare main/SDK copies concurrently; maps each name to "in sync"."""
+        pairs = [(self.root / name, self.sdk_dir / name) for name in file_names]
+        with ThreadPoolExecutor(max_workers=_HASH_WORKERS) as executor:
+            matches = list(executor.map(_files_match, pairs, [self.deep] * len(pairs)))
+        return dict(zip(file_names, matches))
     
     def verify_sync(self) -> List[str]:
         """Check which files are out of sync"""
@@ -59,17 +221,10 @@ class SDKUpdater:
         print("🔍 Verifying SDK sync status...\n")
         
         # Check files
-        for file_name in self.sync_files:
-            main_file = self.root / file_name
-            sdk_file = self.sdk_dir / file_name
-            
-            if not main_file.exists():
-                continue
-            
-            main_hash = self._get_file_hash(main_file)
-            sdk_hash = self._get_file_hash(sdk_file)
-            
-            if main_hash != sdk_hash:
+        present = [name for name in self.sync_files if (self.root / name).exists()]
+        in_sync = self._compare_files(present)
+        for file_name in present:
+            if not in_sync[file_name]:
                 out_of_sync.append(file_name)
                 status = "❌ OUT OF SYNC"
             else:
@@ -93,28 +248,29 @@ class SDKUpdater:
         
         return out_of_sync
     
-    def sync_file(self, file_name: str, force: bool = False):
-        """Sync a single file from main to SDK"""
+    def sync_file(self, file_name: str, force: bool = False,
+                  in_sync: Optional[bool] = None):
+        """Sync a single file from main to SDK (in_sync: precomputed comparison)"""
         main_file = self.root / file_name
         sdk_file = self.sdk_dir / file_name
         
         if not main_file.exists():
-            print(f"  ⚠️  Skipping {file_name} (not found in main)")
+            _say(f"  ⚠️  Skipping {file_name} (not found in main)")
             return False
         
         # Check if different
         if not force:
-            main_hash = self._get_file_hash(main_file)
-            sdk_hash = self._get_file_hash(sdk_file)
+            if in_sync is None:
+                in_sync = _files_match((main_file, sdk_file), self.deep)
             
-            if main_hash == sdk_hash:
-                print(f"  ⏭️  Skipping {file_name} (already in sync)")
+            if in_sync:
+                _say(f"  ⏭️  Skipping {file_name} (already in sync)")
                 return True
         
         # Copy file
         sdk_file.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(main_file, sdk_file)
-        print(f"  ✅ Synced {file_name}")
+        _say(f"  ✅ Synced {file_name}")
         return True
     
     def sync_directory(self, dir_name: str, force: bool = False):
@@ -123,20 +279,40 @@ class SDKUpdater:
         sdk_dir = self.sdk_dir / dir_name
         
         if not main_dir.exists():
-            print(f"  ⚠️  Skipping {dir_name}/ (not found in main)")
+            _say(f"  ⚠️  Skipping {dir_name}/ (not found in main)")
             return False
         
-        # Remove SDK directory if forcing full sync
-        if force and sdk_dir.exists():
-            shutil.rmtree(sdk_dir)
-        
         # Copy directory
-        if not sdk_dir.exists() or force:
-            shutil.copytree(main_dir, sdk_dir, dirs_exist_ok=True)
-            file_count = sum(1 for _ in sdk_dir.rglob("*") if _.is_file())
-            print(f"  ✅ Synced {dir_name}/ ({file_count} files)")
+        if not sdk_dir.exists():
+            _copy_tree_parallel(main_dir, sdk_dir)
+            file_count = sum(len(files) for _, _, files in os.walk(sdk_dir))
+            _say(f"  ✅ Synced {dir_name}/ ({file_count} files)")
+        elif force:
+            # Rewrite only what differs; force compares contents, not stat
+            to_copy, to_delete, to_clear = _diff_trees(main_dir, sdk_dir, deep=True)
+            
+            for rel in to_clear:
+                target = sdk_dir / rel
+                if target.is_dir() and not target.is_symlink():
+                    shutil.rmtree(target)
+                else:
+                    os.unlink(target)
+            
+            for parent in {os.path.dirname(rel) for rel in to_copy}:
+                os.makedirs(sdk_dir / parent, exist_ok=True)
+            _copy_files([(main_dir / rel, sdk_dir / rel) for rel in to_copy])
+            
+            for rel in to_delete:
+                target = sdk_dir / rel
+                if target.is_dir() and not target.is_symlink():
+                    os.rmdir(target)
+                else:
+                    os.unlink(target)
+            
+            removed = len(to_delete) + len(to_clear)
+            _say(f"  ✅ Synced {dir_name}/ ({len(to_copy)} updated, {removed} removed)")
         else:
-            print(f"  ⏭️  Skipping {dir_name}/ (use --force to overwrite)")
+            _say(f"  ⏭️  Skipping {dir_name}/ (use --force to overwrite)")
         
         return True
     
@@ -154,14 +330,30 @@ class SDKUpdater:
                 else:
                     print(f"  ⚠️  Unknown file/directory: {file_name}")
         else:
-            # Sync all files
+            # Sync all files, hashing every pair up front in parallel
             print("📄 Files:")
-            for file_name in self.sync_files:
-                self.sync_file(file_name, force)
+            present = [name for name in self.sync_files if (self.root / name).exists()]
+            in_sync = {} if force else self._compare_files(present)
             
-            print("\n📁 Directories:")
-            for dir_name in self.sync_dirs:
-                self.sync_directory(dir_name, force)
+            # Files and directories sync concurrently; output is replayed in order
+            with ThreadPoolExecutor(max_workers=_SYNC_WORKERS) as executor:
+                file_jobs = [
+                    executor.submit(_captured, self.sync_file, name, force, in_sync.get(name))
+                    for name in self.sync_files
+                ]
+                dir_jobs = [
+                    executor.submit(_captured, self.sync_directory, name, force)
+                    for name in self.sync_dirs
+                ]
+                
+                for job in file_jobs:
+                    for line in job.result()[1]:
+                        print(line)
+                
+                print("\n📁 Directories:")
+                for job in dir_jobs:
+                    for line in job.result()[1]:
+                        print(line)
         
         print("\n✅ SDK sync completed!")
     
@@ -200,6 +392,9 @@ Examples:
   
   # Create sync report
   python tools/update_sdk.py --report
+  
+  # Verify by content hash, ignoring size/mtime shortcuts
+  python tools/update_sdk.py --verify --deep
         """
     )
     
@@ -213,6 +408,8 @@ Examples:
                        help="Specific files to sync")
     parser.add_argument("--report", action="store_true",
                        help="Generate sync report")
+    parser.add_argument("--deep", action="store_true",
+                       help="Compare file contents even when size and mtime match")
     
     args = parser.parse_args()
     
@@ -224,7 +421,7 @@ Examples:
     plhub_root = Path(__file__).parent.parent
     
     # Create updater
-    updater = SDKUpdater(plhub_root)
+    updater = SDKUpdater(plhub_root, deep=args.deep)
     
     # Execute actions
     if args.verify:
@@ -4,19 +4,67 @@ Validate Complete Applications
 Tests that all complete apps can build and run successfully
 """
 
+import json
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+
+# Checks are stat/read bound, so run more apps at once than there are cores
+_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _scan_top(app_dir: Path) -> Dict[str, os.DirEntry]:
+    """List an app's top-level entries once, keyed by (normcased) name."""
+    try:
+        with os.scandir(app_dir) as entries:
+            return {os.path.normcase(entry.name): entry for entry in entries}
+    except OSError:
+        return {}
+
+
+def _top_entry(top: Dict[str, os.DirEntry], name: str) -> Optional[os.DirEntry]:
+    """Look up a top-level entry the way the filesystem would match its name."""
+    return top.get(os.path.normcase(name))
+
+
+def _has_suffix(root: Path, suffix: str) -> bool:
+    """Return True as soon as any file under root ends with suffix."""
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(suffix) and entry.is_file():
+                        return True
+        except OSError:
+            continue
+    return False
 
 
 class AppValidator:
     """Validator for complete PohLang applications."""
     
+    # (report label, checker method name), run in this order for every app
+    _CHECKS = (
+        ("Project structure", "_check_structure"),
+        ("plhub.json config", "_check_config"),
+        ("Source files", "_check_source"),
+        ("Test files", "_check_tests"),
+        ("Documentation", "_check_docs"),
+    )
+    
     def __init__(self, apps_dir: Path):
         """Initialize validator with apps directory."""
         self.apps_dir = Path(apps_dir)
         self.results = []
+        # Parsed plhub.json per app, shared by every check that needs it
+        self._config_cache: Dict[Path, dict] = {}
         
     def validate_all(self) -> bool:
         """
@@ -39,10 +87,13 @@ class AppValidator:
         
         print(f"Found {len(apps)} applications to validate\n")
         
-        # Validate each app
-        for app_dir in sorted(apps):
-            self._validate_app(app_dir)
-            print()
+        # Validate apps concurrently, then report them in name order
+        with ThreadPoolExecutor(max_workers=_WORKERS) as executor:
+            jobs = [executor.submit(self._validate_app, app_dir) for app_dir in sorted(apps)]
+            for job in jobs:
+                app_name, all_passed, lines = job.result()
+                sys.stdout.write("\n".join(lines) + "\n\n")
+                self.results.append((app_name, all_passed))
         
         # Print summary
         self._print_summary()
@@ -50,148 +101,150 @@ class AppValidator:
         # Return overall success
         return all(result[1] for result in self.results)
     
-    def _validate_app(self, app_dir: Path):
-        """Validate a single application."""
+    def _validate_app(self, app_dir: Path) -> Tuple[str, bool, List[str]]:
+        """
+        Validate a single application.
+        
+        Returns:
+            (app name, whether every check passed, report lines to print)
+        """
         app_name = app_dir.name
-        print(f"═══ {app_name.upper()} ═══")
-        
-        checks = [
-            ("Project structure", lambda: self._check_structure(app_dir)),
-            ("plhub.json config", lambda: self._check_config(app_dir)),
-            ("Source files", lambda: self._check_source(app_dir)),
-            ("Test files", lambda: self._check_tests(app_dir)),
-            ("Documentation", lambda: self._check_docs(app_dir)),
-        ]
+        out = [f"═══ {app_name.upper()} ═══"]
         
         all_passed = True
+        # One directory read answers every top-level existence question
+        top = _scan_top(app_dir)
         
-        for check_name, check_func in checks:
+        for check_name, attr in self._CHECKS:
             try:
-                passed = check_func()
+                passed = getattr(self, attr)(app_dir, top, out)
                 status = "✅" if passed else "❌"
-                print(f"  {status} {check_name}")
+                out.append(f"  {status} {check_name}")
                 if not passed:
                     all_passed = False
             except Exception as e:
-                print(f"  ❌ {check_name}: {e}")
+                out.append(f"  ❌ {check_name}: {e}")
                 all_passed = False
         
-        self.results.append((app_name, all_passed))
+        return app_name, all_passed, out
     
-    def _check_structure(self, app_dir: Path) -> bool:
+    def _check_structure(self, app_dir: Path, top: Dict[str, os.DirEntry],
+                         out: List[str]) -> bool:
         """Check that required directories exist."""
-        required = ["src", "tests"]
-        
-        for dir_name in required:
-            if not (app_dir / dir_name).exists():
-                print(f"      Missing: {dir_name}/")
+        for dir_name in ("src", "tests"):
+            # Must be a directory: a stray file named "src" is not a source tree
+            entry = _top_entry(top, dir_name)
+            if entry is None or not entry.is_dir():
+                out.append(f"      Missing: {dir_name}/")
                 return False
         
         return True
     
-    def _check_config(self, app_dir: Path) -> bool:
+    def _check_config(self, app_dir: Path, top: Dict[str, os.DirEntry],
+                      out: List[str]) -> bool:
         """Check plhub.json exists and is valid."""
-        config_file = app_dir / "plhub.json"
+        config_entry = _top_entry(top, "plhub.json")
         
-        if not config_file.exists():
-            print("      Missing: plhub.json")
+        if config_entry is None:
+            out.append("      Missing: plhub.json")
             return False
         
         try:
-            import json
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            config = self._config_cache.get(app_dir)
+            if config is None:
+                with open(config_entry.path, "rb") as f:
+                    config = json.loads(f.read())
+                self._config_cache[app_dir] = config
             
             required_fields = ["name", "version", "main"]
             missing = [field for field in required_fields if field not in config]
             
             if missing:
-                print(f"      Missing fields: {', '.join(missing)}")
+                out.append(f"      Missing fields: {', '.join(missing)}")
                 return False
             
             return True
             
         except json.JSONDecodeError as e:
-            print(f"      Invalid JSON: {e}")
+            out.append(f"      Invalid JSON: {e}")
             return False
     
-    def _check_source(self, app_dir: Path) -> bool:
+    def _check_source(self, app_dir: Path, top: Dict[str, os.DirEntry],
+                      out: List[str]) -> bool:
         """Check that source files exist."""
-        src_dir = app_dir / "src"
-        
-        if not src_dir.exists():
+        if _top_entry(top, "src") is None:
             return False
+        src_dir = app_dir / "src"
         
-        poh_files = list(src_dir.rglob("*.poh"))
-        
-        if not poh_files:
-            print("      No .poh files found")
+        if not _has_suffix(src_dir, ".poh"):
+            out.append("      No .poh files found")
             return False
         
         # Check main file exists
         main_file = src_dir / "main.poh"
         if not main_file.exists():
-            print("      Missing: src/main.poh")
+            out.append("      Missing: src/main.poh")
             return False
         
         return True
     
-    def _check_tests(self, app_dir: Path) -> bool:
+    def _check_tests(self, app_dir: Path, top: Dict[str, os.DirEntry],
+                     out: List[str]) -> bool:
         """Check that test files exist."""
-        tests_dir = app_dir / "tests"
-        
-        if not tests_dir.exists():
+        if _top_entry(top, "tests") is None:
             return False
         
-        test_files = list(tests_dir.rglob("*.poh"))
-        
-        if not test_files:
-            print("      No test files found")
+        if not _has_suffix(app_dir / "tests", ".poh"):
+            out.append("      No test files found")
             return False
         
         return True
     
-    def _check_docs(self, app_dir: Path) -> bool:
+    def _check_docs(self, app_dir: Path, top: Dict[str, os.DirEntry],
+                    out: List[str]) -> bool:
         """Check that documentation exists."""
-        readme = app_dir / "README.md"
+        readme = _top_entry(top, "README.md")
         
-        if not readme.exists():
-            print("      Missing: README.md")
+        if readme is None:
+            out.append("      Missing: README.md")
             return False
         
-        # Check README has content
-        content = readme.read_text()
-        if len(content) < 100:
-            print("      README too short")
+        # Check README has content; the byte size is enough, no need to read it
+        st = readme.stat()
+        if st.st_size < 100:
+            out.append("      README too short")
             return False
         
         return True
     
     def _print_summary(self):
         """Print validation summary."""
-        print("╔════════════════════════════════════════╗")
-        print("║         VALIDATION SUMMARY             ║")
-        print("╚════════════════════════════════════════╝")
-        print()
-        
         total = len(self.results)
         passed = sum(1 for _, success in self.results if success)
         failed = total - passed
         
+        lines = [
+            "╔════════════════════════════════════════╗",
+            "║         VALIDATION SUMMARY             ║",
+            "╚════════════════════════════════════════╝",
+            "",
+        ]
         for app_name, success in self.results:
             status = "✅ PASS" if success else "❌ FAIL"
-            print(f"  {status}  {app_name}")
+            lines.append(f"  {status}  {app_name}")
         
-        print()
-        print(f"Total:  {total} applications")
-        print(f"Passed: {passed} ({passed*100//total if total > 0 else 0}%)")
-        print(f"Failed: {failed}")
-        print()
+        lines.append("")
+        lines.append(f"Total:  {total} applications")
+        lines.append(f"Passed: {passed} ({passed*100//total if total > 0 else 0}%)")
+        lines.append(f"Failed: {failed}")
+        lines.append("")
         
         if failed == 0:
-            print("✨ All applications are valid! 🎉")
+            lines.append("✨ All applications are valid! 🎉")
         else:
-            print(f"⚠️  {failed} application(s) need attention")
+            lines.append(f"⚠️  {failed} application(s) need attention")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -2,14 +2,35 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from pathlib import Path
+from functools import cached_property, lru_cache
+from pathlib import Path, PurePosixPath, PureWindowsPath
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 import json
+import os
 import re
-
-
-@dataclass
+import sys
+
+
+# ``{{key}}`` placeholders; unknown keys are left untouched when rendering
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+# slugify: drop anything that is not alphanumeric or a separator, then
+# collapse each run of separators (" ", "-", "_", ".") into one underscore
+_SLUG_DROP_RE = re.compile(r"[^\w .-]+")
+_SLUG_SEP_RE = re.compile(r"[ ._-]+")
+# ASCII fast path: lowercase, map separators to "_" and drop the rest in one
+# translate (a list indexed by code point is the quickest table form)
+_SLUG_ASCII_TABLE = [
+    ch.lower() if ch.isalnum() else "_" if ch in " -_." else None
+    for ch in map(chr, range(128))
+]
+# _split_words: camel/Pascal-case words first, plain alphanumeric runs as fallback
+_SPLIT_CAMEL_RE = re.compile(r"[A-Z]?[a-z0-9]+|[A-Z]+(?=[A-Z][a-z]|\b)")
+_SPLIT_FALLBACK_RE = re.compile(r"[a-z0-9]+", re.IGNORECASE)
+
+
+@dataclass(eq=False, repr=False)
 class WidgetFileSpec:
     """Definition of a single file emitted by a widget template."""
 
@@ -18,8 +39,11 @@ class WidgetFileSpec:
     description: Optional[str]
     overwrite: bool
 
+    def __repr__(self) -> str:
+        return f"<WidgetFileSpec {self.path!r}>"
+
 
-@dataclass
+@dataclass(eq=False, repr=False)
 class WidgetTemplate:
     """Metadata and file definitions for a widget template."""
 
@@ -32,6 +56,62 @@ class WidgetTemplate:
     path: Path
     files: Sequence[WidgetFileSpec]
     preview: Optional[str]
+    # Normalized identifiers that resolve to this template, computed at parse time
+    alias_keys: Tuple[str, ...] = ()
+
+    def __repr__(self) -> str:
+        return f"<WidgetTemplate {self.key!r} ({self.source})>"
+
+
+def _normalize_content(content: Any) -> str:
+    """Template file content (a string or a list of lines) ending in one newline."""
+    if isinstance(content, list):
+        return "\n".join(map(str, content)).rstrip() + "\n"
+    content_str = str(content)
+    return content_str if content_str.endswith("\n") else content_str + "\n"
+
+
+def _file_spec(file_def: Dict[str, Any]) -> WidgetFileSpec:
+    """Build one WidgetFileSpec from its raw JSON definition."""
+    get = file_def.get
+    return WidgetFileSpec(
+        path=str(get("path")),
+        content=_normalize_content(get("content", "")),
+        description=get("description"),
+        overwrite=bool(get("overwrite", False)),
+    )
+
+
+@lru_cache(maxsize=256)
+def _context_items(name: str) -> Tuple[Tuple[str, str], ...]:
+    """Placeholder values for a widget name, memoized as an immutable tuple."""
+    base = name.strip()
+    if not base:
+        base = "Widget"
+    words = WidgetManager._split_words(base)
+    slug_parts = [WidgetManager.slugify(word) for word in words]
+    slug_parts = [part for part in slug_parts if part]
+    snake = "_".join(slug_parts) if slug_parts else WidgetManager.slugify(base)
+    snake = snake.replace("-", "_") or "widget"
+    parts = [p for p in snake.split("_") if p]
+    pascal = "".join(part.capitalize() for part in parts) or "Widget"
+    kebab = "-".join(parts) or "widget"
+    title = " ".join(part.capitalize() for part in parts) or base.title()
+    return (
+        ("widget_name", base),
+        ("widget_snake", snake),
+        ("widget_pascal", pascal),
+        ("widget_kebab", kebab),
+        ("widget_title", title),
+    )
+
+
+def _read_bytes(path: Path) -> Optional[bytes]:
+    """File contents, or None if it cannot be read."""
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
 
 
 class WidgetManager:
@@ -53,36 +133,43 @@ class WidgetManager:
             project_root / self.PROJECT_TEMPLATES_DIR if project_root else None
         )
 
-        self._builtin_templates: Dict[str, WidgetTemplate] = self._load_templates(
-            self.builtin_dir, source="builtin"
-        )
-        self._project_templates: Dict[str, WidgetTemplate] = (
-            self._load_templates(self.project_templates_dir, source="project")
-            if self.project_templates_dir
-            else {}
-        )
-        self._templates: Dict[str, WidgetTemplate] = {
-            **self._builtin_templates,
-            **self._project_templates,
-        }
-        self._aliases: Dict[str, str] = {}
-        self._register_aliases(self._builtin_templates.values())
-        self._register_aliases(self._project_templates.values())
+    # ------------------------------------------------------------------
+    # Template indexes, each loaded on first use
+    # ------------------------------------------------------------------
+    @cached_property
+    def _builtin_templates(self) -> Dict[str, WidgetTemplate]:
+        return self._load_templates(self.builtin_dir, source="builtin")
+
+    @cached_property
+    def _project_templates(self) -> Dict[str, WidgetTemplate]:
+        if not self.project_templates_dir:
+            return {}
+        return self._load_templates(self.project_templates_dir, source="project")
+
+    @cached_property
+    def _templates(self) -> Dict[str, WidgetTemplate]:
+        return {**self._builtin_templates, **self._project_templates}
+
+    @cached_property
+    def _aliases(self) -> Dict[str, str]:
+        # Project templates come last so their aliases win
+        aliases: Dict[str, str] = {}
+        self._register_aliases(aliases, self._builtin_templates.values())
+        self._register_aliases(aliases, self._project_templates.values())
+        return aliases
 
     # ------------------------------------------------------------------
     # Template discovery helpers
     # ------------------------------------------------------------------
     @staticmethod
     def slugify(value: str) -> str:
-        cleaned: List[str] = []
-        for ch in value.strip().lower():
-            if ch.isalnum():
-                cleaned.append(ch)
-            elif ch in {" ", "-", "_", "."}:
-                cleaned.append("_")
-        slug = "".join(cleaned)
-        while "__" in slug:
-            slug = slug.replace("__", "_")
+        value = value.strip()
+        if value.isascii():
+            slug = value.translate(_SLUG_ASCII_TABLE)
+            if "__" in slug:
+                slug = _SLUG_SEP_RE.sub("_", slug)
+        else:
+            slug = _SLUG_SEP_RE.sub("_", _SLUG_DROP_RE.sub("", value.lower()))
         return slug.strip("_") or "widget"
 
     @staticmethod
@@ -92,59 +179,57 @@ class WidgetManager:
             value = value[:-5]
         return WidgetManager.slugify(value)
 
-    def _register_aliases(self, templates: Iterable[WidgetTemplate]) -> None:
+    def _register_aliases(
+        self, aliases: Dict[str, str], templates: Iterable[WidgetTemplate]
+    ) -> None:
         for template in templates:
-            key = template.key
-            self._aliases[key] = key
-            self._aliases[self._normalize(template.name)] = key
-            self._aliases[self._normalize(template.path.stem)] = key
-            self._aliases[self._normalize(template.path.name)] = key
+            for alias in template.alias_keys:
+                aliases[alias] = template.key
 
     def _load_templates(
         self, directory: Optional[Path], *, source: str
     ) -> Dict[str, WidgetTemplate]:
         results: Dict[str, WidgetTemplate] = {}
-        if not directory or not directory.exists():
+        if not directory:
             return results
-        for json_path in sorted(directory.glob("*.json")):
-            template = self._parse_template(json_path, source)
+        try:
+            with os.scandir(directory) as it:
+                json_paths = sorted(
+                    Path(e.path) for e in it if e.name.endswith(".json") and e.is_file()
+                )
+        except OSError:
+            return results
+
+        # Read every file first (overlapped when there are several), then parse
+        if len(json_paths) > 2:
+            with ThreadPoolExecutor(max_workers=min(4, len(json_paths))) as executor:
+                raws = list(executor.map(_read_bytes, json_paths))
+        else:
+            raws = [_read_bytes(json_path) for json_path in json_paths]
+
+        for json_path, data in zip(json_paths, raws):
+            template = self._parse_template(json_path, source, data) if data is not None else None
             if template:
                 results[template.key] = template
         return results
 
     def _parse_template(
-        self, json_path: Path, source: str
+        self, json_path: Path, source: str, data: Optional[bytes] = None
     ) -> Optional[WidgetTemplate]:
         try:
-            raw = json.loads(json_path.read_text(encoding="utf-8"))
+            raw = json.loads(json_path.read_bytes() if data is None else data)
         except (OSError, json.JSONDecodeError):
             return None
 
-        key = raw.get("key") or self.slugify(json_path.stem)
-        name = raw.get("name") or json_path.stem.replace("_", " ").title()
-        description = raw.get("description")
-        category = raw.get("category")
-        tags = tuple(raw.get("tags", []))
-
-        files: List[WidgetFileSpec] = []
-        for file_def in raw.get("files", []):
-            content = file_def.get("content", "")
-            if isinstance(content, list):
-                content_str = "\n".join(str(line) for line in content).rstrip() + "\n"
-            else:
-                content_str = str(content)
-                if not content_str.endswith("\n"):
-                    content_str += "\n"
-            files.append(
-                WidgetFileSpec(
-                    path=str(file_def.get("path")),
-                    content=content_str,
-                    description=file_def.get("description"),
-                    overwrite=bool(file_def.get("overwrite", False)),
-                )
-            )
+        get = raw.get
+        key = get("key") or self.slugify(json_path.stem)
+        name = get("name") or json_path.stem.replace("_", " ").title()
+        description = get("description")
+        category = get("category")
+        tags = tuple(get("tags", ()))
+        files = tuple(map(_file_spec, get("files", ())))
 
-        preview_lines = raw.get("preview")
+        preview_lines = get("preview")
         preview: Optional[str]
         if isinstance(preview_lines, list):
             preview = "\n".join(str(line) for line in preview_lines)
@@ -153,16 +238,28 @@ class WidgetManager:
         else:
             preview = None
 
+        key = sys.intern(self.slugify(key))
+        alias_keys = tuple(
+            sys.intern(alias)
+            for alias in (
+                key,
+                self._normalize(name),
+                self._normalize(json_path.stem),
+                self._normalize(json_path.name),
+            )
+        )
+
         return WidgetTemplate(
-            key=self.slugify(key),
+            key=key,
             name=name,
             description=description,
             category=category,
             tags=tags,
             source=source,
             path=json_path,
-            files=tuple(files),
+            files=files,
             preview=preview,
+            alias_keys=alias_keys,
         )
 
     # ------------------------------------------------------------------
@@ -255,11 +352,22 @@ class WidgetManager:
 
         for file_spec in template.files:
             relative_path = self._render_string(file_spec.path, context)
-            if Path(relative_path).is_absolute() or relative_path.startswith(".."):
+            # Normalize once, without touching the filesystem; reject anything
+            # that could land outside the project (absolute, drive, or "..")
+            parts = PurePosixPath(relative_path.replace("\\", "/")).parts
+            # A drive in any segment ("C:x", "ui/C:x") resets joinpath on Windows
+            if (
+                not parts
+                or parts[0] == "/"
+                or ".." in parts
+                or PureWindowsPath(relative_path).root
+                or any(PureWindowsPath(part).drive for part in parts)
+                or Path(relative_path).is_absolute()
+            ):
                 raise ValueError(
                     f"Invalid widget file path '{relative_path}'. Paths must be project-relative."
                 )
-            destination = self.project_root / relative_path
+            destination = self.project_root.joinpath(*parts)
             if destination.exists() and not (force or file_spec.overwrite):
                 raise FileExistsError(
                     f"Widget file '{relative_path}' already exists. Use --force to overwrite."
@@ -344,38 +452,17 @@ class WidgetManager:
 
     @staticmethod
     def _build_context(name: str) -> Dict[str, str]:
-        base = name.strip()
-        if not base:
-            base = "Widget"
-        words = WidgetManager._split_words(base)
-        slug_parts = [WidgetManager.slugify(word) for word in words]
-        slug_parts = [part for part in slug_parts if part]
-        snake = "_".join(slug_parts) if slug_parts else WidgetManager.slugify(base)
-        snake = snake.replace("-", "_") or "widget"
-        parts = [p for p in snake.split("_") if p]
-        pascal = "".join(part.capitalize() for part in parts) or "Widget"
-        kebab = "-".join(parts) or "widget"
-        title = " ".join(part.capitalize() for part in parts) or base.title()
-        return {
-            "widget_name": base,
-            "widget_snake": snake,
-            "widget_pascal": pascal,
-            "widget_kebab": kebab,
-            "widget_title": title,
-        }
+        return dict(_context_items(name))
 
     @staticmethod
     def _render_string(template: str, context: Dict[str, str]) -> str:
-        result = template
-        for key, value in context.items():
-            result = result.replace(f"{{{{{key}}}}}", value)
-        return result
+        # Most template files (and many paths) contain no placeholder at all
+        if "{{" not in template:
+            return template
+        return _PLACEHOLDER_RE.sub(lambda m: context.get(m.group(1), m.group(0)), template)
 
     @staticmethod
     def _split_words(value: str) -> List[str]:
         if not value:
             return []
-        matches = re.findall(r"[A-Z]?[a-z0-9]+|[A-Z]+(?=[A-Z][a-z]|\b)", value)
-        if matches:
-            return matches
-        return re.findall(r"[a-z0-9]+", value, flags=re.IGNORECASE)
+        return _SPLIT_CAMEL_RE.findall(value) or _SPLIT_FALLBACK_RE.findall(value)